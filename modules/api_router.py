@@ -39,6 +39,7 @@ from email.policy import default
 from urllib.parse import parse_qs
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request, BackgroundTasks, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse, RedirectResponse
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import BaseModel
@@ -768,7 +769,10 @@ def build_router() -> APIRouter:
 
         _, auth, _, _, _ = get_dependencies()
         try:
-            token = auth.login(username, password, client_id=_client_identifier(request))
+            # bcrypt verification takes hundreds of milliseconds; keep it off the event loop
+            token = await run_in_threadpool(
+                auth.login, username, password, client_id=_client_identifier(request)
+            )
             exp_minutes = auth.token_exp_minutes
             return TokenResponse(access_token=token, expires_in=exp_minutes * 60)
         except AuthenticationSetupRequired as exc:
@@ -12,9 +12,11 @@ Security notes:
 """
 
 import logging
+import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any, ClassVar
+from typing import Optional, Dict, Any, ClassVar, Iterator
 
 import bcrypt
 from jose import JWTError, jwt
@@ -90,6 +92,12 @@ class AuthUtils:
 
     _failed_login_attempts: ClassVar[dict[str, list[float]]] = {}
     _locked_login_keys: ClassVar[dict[str, float]] = {}
+    # One lock per rate-limit key, held for a whole login so the rate-limit
+    # check, password verification and failure bookkeeping stay atomic for
+    # that key while logins under other keys run concurrently. Each entry
+    # counts the logins holding or waiting on it and is dropped at zero.
+    _login_key_locks: ClassVar[dict[str, tuple[threading.Lock, int]]] = {}
+    _login_key_locks_guard: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self, config: ConfigManager):
         """Initialize utilities from configuration.
@@ -173,6 +181,27 @@ class AuthUtils:
         cls._failed_login_attempts.clear()
         cls._locked_login_keys.clear()
 
+    @classmethod
+    @contextmanager
+    def _login_key_lock(cls, key: str) -> Iterator[None]:
+        """Hold the login lock for a rate-limit key, creating it on first use."""
+
+        with cls._login_key_locks_guard:
+            lock, users = cls._login_key_locks.get(key, (None, 0))
+            if lock is None:
+                lock = threading.Lock()
+            cls._login_key_locks[key] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with cls._login_key_locks_guard:
+                lock, users = cls._login_key_locks[key]
+                if users > 1:
+                    cls._login_key_locks[key] = (lock, users - 1)
+                else:
+                    del cls._login_key_locks[key]
+
     def _login_rate_limit_key(self, username: str, client_id: str | None) -> str:
         """Return the throttling key for a username and client identifier."""
 
@@ -333,6 +362,11 @@ class AuthUtils:
             - Common Issue: Login succeeds but token validation fails immediately. Resolution: Ensure web.token_exp_minutes is set to a reasonable value (default 30 minutes).
             - Common Issue: Password hash format incompatibility. Resolution: Regenerate password hash using bcrypt with rounds=12 if using different bcrypt implementation.
         """
+        with self._login_key_lock(self._login_rate_limit_key(username, client_id)):
+            return self._login(username, password, client_id)
+
+    def _login(self, username: str, password: str, client_id: str | None) -> str:
+        """Authenticate while holding the rate-limit key's login lock; see login()."""
         self.logger.info(f"Login attempt for username: {username}")
         rate_limit_key = self._ensure_login_not_rate_limited(username, client_id)
         
@@ -1,3 +1,5 @@
+import threading
+import time
 from datetime import timedelta
 from pathlib import Path
 from typing import Any, cast
@@ -168,6 +170,82 @@ def test_rate_limit_disabled_expired_lock_and_window_pruning(tmp_path, monkeypat
     assert auth._ensure_login_not_rate_limited("", "") == "unknown:<blank>"
 
 
+def test_concurrent_failed_logins_cannot_bypass_rate_limit(tmp_path, monkeypatch):
+    config = _config(tmp_path, {"auth": {"login_max_failed_attempts": 2}})
+    with connect(config) as conn:
+        UserRepository(conn).initialize(
+            {
+                "admin": _hash("AdminPassword1!"),
+                "operator": _hash("OperatorPass1!"),
+            }
+        )
+    auth = AuthUtils(config)
+    AuthUtils.reset_login_rate_limits()
+    verified: list[str] = []
+
+    def slow_reject(password: str, hashed: str) -> bool:
+        verified.append(password)
+        time.sleep(0.05)
+        return False
+
+    monkeypatch.setattr(auth, "verify_password", slow_reject)
+    outcomes: list[type] = []
+
+    def attempt() -> None:
+        try:
+            auth.login("admin", "guess", client_id="client")
+        except AuthError as exc:
+            outcomes.append(type(exc))
+
+    threads = [threading.Thread(target=attempt) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(verified) == 2
+    assert outcomes.count(LoginRateLimitError) == 4
+    AuthUtils.reset_login_rate_limits()
+
+
+def test_logins_under_different_keys_run_concurrently(tmp_path, monkeypatch):
+    config = _config(tmp_path)
+    with connect(config) as conn:
+        UserRepository(conn).initialize(
+            {
+                "admin": _hash("AdminPassword1!"),
+                "operator": _hash("OperatorPass1!"),
+            }
+        )
+    auth = AuthUtils(config)
+    AuthUtils.reset_login_rate_limits()
+    # Both verifications must be in progress at once to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def overlapping_reject(password: str, hashed: str) -> bool:
+        barrier.wait()
+        return False
+
+    monkeypatch.setattr(auth, "verify_password", overlapping_reject)
+    outcomes: list[type] = []
+
+    def attempt(client_id: str) -> None:
+        try:
+            auth.login("admin", "guess", client_id=client_id)
+        except Exception as exc:
+            outcomes.append(type(exc))
+
+    threads = [threading.Thread(target=attempt, args=(client,)) for client in ("client-a", "client-b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert outcomes == [AuthError, AuthError]
+    assert AuthUtils._login_key_locks == {}
+    AuthUtils.reset_login_rate_limits()
+
+
 def test_get_current_user_rejects_invalid_payloads_and_wraps_errors(tmp_path, monkeypatch):
     config = _config(tmp_path)
     with connect(config) as conn:
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from typing import Callable
 from unittest.mock import patch, MagicMock
@@ -136,6 +137,47 @@ def test_login_failure_returns_login_page_with_error(client, mock_auth):
     assert 'form action="/auth/login"' in resp.text
 
 
+def _login_outside_event_loop(mock_auth, monkeypatch) -> list[bool]:
+    """Patch FakeAuth.login to record whether each call ran on the event loop."""
+    on_event_loop: list[bool] = []
+    original_login = mock_auth.login
+
+    def recording_login(self, username: str, password: str, client_id: str | None = None) -> str:
+        try:
+            asyncio.get_running_loop()
+            on_event_loop.append(True)
+        except RuntimeError:
+            on_event_loop.append(False)
+        return original_login(self, username, password, client_id=client_id)
+
+    monkeypatch.setattr(mock_auth, "login", recording_login)
+    return on_event_loop
+
+
+def test_login_verifies_password_off_event_loop(client, mock_auth, monkeypatch):
+    on_event_loop = _login_outside_event_loop(mock_auth, monkeypatch)
+
+    resp = client.post(
+        "/login",
+        data={"username": "admin", "password": "secret"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        follow_redirects=False,
+    )
+
+    assert resp.status_code == 303
+    assert on_event_loop == [False]
+
+
+def test_api_login_verifies_password_off_event_loop(api_client, mock_auth, monkeypatch):
+    on_event_loop = _login_outside_event_loop(mock_auth, monkeypatch)
+
+    resp = api_client.post("/api/login", json={"username": "admin", "password": "secret"})
+
+    assert resp.status_code == 200
+    assert resp.json()["access_token"] == TOKEN
+    assert on_event_loop == [False]
+
+
 def test_api_login_rate_limit_returns_429(monkeypatch, tmp_path: Path):
     password_hash = bcrypt.hashpw(b"secret", bcrypt.gensalt()).decode("utf-8")
     config = TempConfig(
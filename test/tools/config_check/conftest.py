@@ -149,3 +149,14 @@ def config_factory(tmp_path: Path) -> ConfigFactory:
     """Provide a ConfigFactory scoped to the temporary directory."""
 
     return ConfigFactory(tmp_path)
+
+
+@pytest.fixture(autouse=True)
+def csv_schema_cache_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the runtime validator's CSV schema cache out of the user's home directory."""
+
+    from tools.config_check import runtime_file_validator
+
+    cache_dir = tmp_path_factory.mktemp("csv-schema-cache")
+    monkeypatch.setattr(runtime_file_validator, "_CSV_SCHEMA_CACHE_DIR", cache_dir)
+    return cache_dir
@@ -148,6 +148,29 @@ class TestValidationReporter:
         assert len(warning_findings) == 1
         assert warning_findings[0].path == "web.port"
 
+    def test_add_validation_result_with_validation_messages(self):
+        """Test that ValidationMessage suggestions and codes are carried over."""
+        from tools.config_check.validator import ValidationMessage, ValidationResult
+
+        result = ValidationResult(
+            errors=[
+                ValidationMessage(
+                    path="web.upload_dir",
+                    message="Directory not found",
+                    code="path-error",
+                    suggestion="Create the directory",
+                )
+            ],
+            warnings=[ValidationMessage(path="web.port", message="Non-standard port")],
+        )
+
+        reporter = ValidationReporter()
+        reporter.add_validation_result(result, config_path="/app/config.yaml")
+
+        assert [f.suggestion for f in reporter.findings] == ["Create the directory", None]
+        assert [f.code for f in reporter.findings] == ["path-error", None]
+        assert reporter.determine_exit_code() == 1
+
     def test_text_format_output_empty(self):
         """Test text format output with no findings."""
         reporter = ValidationReporter(output_format="text")
@@ -394,6 +417,67 @@ class TestValidationReporter:
         report_content = output.getvalue()
         assert "[ERROR] test.path: Test error" in report_content
 
+    def test_repeated_finding_text_is_shared(self):
+        """Test that identical messages reuse a single string object."""
+        reporter = ValidationReporter()
+        message_a = "".join(["Missing required ", "field"])
+        message_b = "".join(["Missing required ", "field"])
+        assert message_a is not message_b
+
+        reporter.add_finding("tasks.a.params", FindingLevel.ERROR, message_a)
+        reporter.add_finding("tasks.b.params", FindingLevel.ERROR, message_b)
+
+        assert reporter.findings[0].message is reporter.findings[1].message
+
+    def test_sort_findings_orders_by_severity(self):
+        """Test that sort_findings puts errors first and keeps order within a level."""
+        reporter = ValidationReporter(output_format="json")
+        reporter.add_finding("info.path", FindingLevel.INFO, "Info message")
+        reporter.add_finding("warning.path", FindingLevel.WARNING, "Warning message")
+        reporter.add_finding("error.first", FindingLevel.ERROR, "First error")
+        reporter.add_finding("error.second", FindingLevel.ERROR, "Second error")
+        unsorted_report = reporter.generate_report()
+
+        reporter.sort_findings()
+
+        assert [f.path for f in reporter.findings] == [
+            "error.first",
+            "error.second",
+            "warning.path",
+            "info.path",
+        ]
+        sorted_paths = [f["path"] for f in json.loads(reporter.generate_report())["findings"]]
+        assert sorted_paths[0] == "error.first"
+        assert reporter.generate_report() != unsorted_report
+
+    def test_findings_is_read_only_snapshot(self):
+        """Test that findings cannot be mutated around the cached counts."""
+        reporter = ValidationReporter()
+        reporter.add_finding("error.path", FindingLevel.ERROR, "Error message")
+
+        findings = reporter.findings
+        assert isinstance(findings, tuple)
+        assert not hasattr(findings, "append")
+
+        reporter.add_finding("warning.path", FindingLevel.WARNING, "Warning message")
+        assert len(findings) == 1
+        assert len(reporter.findings) == 2
+        assert reporter.generate_summary() == "Validation failed with 1 error, 1 warning, 0 info messages."
+
+    def test_report_regenerated_after_same_size_replacement(self):
+        """Test that replacing findings with the same number of new ones refreshes the report."""
+        reporter = ValidationReporter()
+        reporter.add_finding("web.port", FindingLevel.ERROR, "First problem")
+        first = reporter.generate_report()
+
+        reporter.clear_findings()
+        reporter.add_finding("web.host", FindingLevel.ERROR, "Second problem")
+        second = reporter.generate_report()
+
+        assert "First problem" in first
+        assert "Second problem" in second
+        assert "First problem" not in second
+
     def test_clear_findings_method(self):
         """Test the clear_findings method."""
         reporter = ValidationReporter()
@@ -485,3 +569,51 @@ class TestIntegration:
 
 
 
+
+    def test_print_report_json_matches_generated_report(self):
+        """Test that streamed JSON output matches generate_report exactly."""
+        for count, pretty in ((0, False), (0, True), (1, False), (1, True), (3, False), (3, True)):
+            output = StringIO()
+            reporter = ValidationReporter(output_format="json", output_file=output, pretty=pretty)
+            for index in range(count):
+                reporter.add_finding(
+                    path=f"tasks.task_{index}.params",
+                    level=FindingLevel.WARNING if index % 2 else FindingLevel.ERROR,
+                    message=f"Problem {index}\nwith newline",
+                    suggestion="Fix it" if index else None,
+                    code="sample-code",
+                    config_path="config.yaml",
+                )
+
+            reporter.print_report()
+
+            assert output.getvalue() == reporter.generate_report() + "\n"
+
+    def test_json_report_escapes_non_ascii(self):
+        """Test that JSON output stays ASCII for Windows consoles in every write path."""
+        for pretty in (False, True):
+            output = StringIO()
+            reporter = ValidationReporter(output_format="json", output_file=output, pretty=pretty)
+            reporter.add_finding("tasks.extract.params", FindingLevel.ERROR, "Champ « montant » invalide")
+
+            report = reporter.generate_report()
+            reporter.print_report()
+
+            assert report.isascii()
+            assert "\\u00ab" in report
+            assert output.getvalue() == report + "\n"
+            assert json.loads(report)["findings"][0]["message"] == "Champ « montant » invalide"
+
+    def test_json_report_compact_by_default(self):
+        """Test that JSON output is compact unless pretty printing is requested."""
+        compact = ValidationReporter(output_format="json")
+        pretty = ValidationReporter(output_format="json", pretty=True)
+        for reporter in (compact, pretty):
+            reporter.add_finding("web.port", FindingLevel.WARNING, "Non-standard port")
+
+        compact_report = compact.generate_report()
+        pretty_report = pretty.generate_report()
+
+        assert "\n" not in compact_report
+        assert pretty_report.startswith('{\n  "status": "warning"')
+        assert json.loads(compact_report) == json.loads(pretty_report)
@@ -11,6 +11,7 @@ import json
 import os
 import stat
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Dict
 
 import pytest
@@ -71,6 +72,31 @@ class TestRuntimeFileValidator:
         resolved = validator._resolve_path("test.txt")
         assert resolved == tmp_path / "test.txt"
 
+    def test_reused_validator_sees_file_system_changes(self, tmp_path: Path) -> None:
+        """Test cached stat results do not leak between validation runs."""
+        validator = RuntimeFileValidator(tmp_path)
+        config = {"web": {"upload_dir": "uploads"}}
+
+        first = validator.validate_file_dependencies(config)
+        (tmp_path / "uploads").mkdir()
+        second = validator.validate_file_dependencies(config)
+
+        assert [e.code for e in first.errors] == ["directory-not-found"]
+        assert second.errors == []
+
+    def test_invalid_windows_path_reported_missing(self, tmp_path: Path, monkeypatch) -> None:
+        """Test a Windows invalid-name error is reported as a missing path."""
+        def invalid_name(path, *args, **kwargs):
+            exc = OSError(22, "The filename, directory name, or volume label syntax is incorrect")
+            exc.winerror = 123  # type: ignore[attr-defined]
+            raise exc
+
+        monkeypatch.setattr("tools.config_check.runtime_file_validator.os.stat", invalid_name)
+        validator = RuntimeFileValidator(tmp_path)
+        result = validator.validate_file_dependencies({"web": {"upload_dir": "bad?dir"}})
+
+        assert [e.code for e in result.errors] == ["directory-not-found"]
+
 
 class TestReferenceFileValidation:
     """Tests for reference file validation in rules tasks."""
@@ -101,6 +127,23 @@ class TestReferenceFileValidation:
         assert len(errors) == 0
         assert len(warnings) == 0
 
+    def test_validate_reference_files_module_merely_containing_rules(self) -> None:
+        """Test validation only treats rules-package modules as rules tasks."""
+        validator = RuntimeFileValidator()
+        config = {
+            "tasks": {
+                "store_rulesets": {
+                    "module": "standard_step.storage.store_rulesets",
+                    "class": "StoreRulesets",
+                    "params": {"reference_file": "missing.csv"}
+                }
+            }
+        }
+        
+        errors, warnings = validator._validate_reference_files(config)
+        assert len(errors) == 0
+        assert len(warnings) == 0
+
     def test_validate_reference_files_missing_file(self, tmp_path: Path) -> None:
         """Test validation reports missing reference files."""
         validator = RuntimeFileValidator(tmp_path)
@@ -232,6 +275,23 @@ class TestDirectoryPermissionValidation:
         assert "Web upload directory does not exist" in errors[0].message
         assert errors[0].path == "web.upload_dir"
 
+    def test_validate_directory_permissions_sibling_directories(self, tmp_path: Path) -> None:
+        """Test directories sharing a parent are each checked correctly."""
+        (tmp_path / "watch").mkdir()
+        (tmp_path / "not_a_dir").write_text("x", encoding="utf-8")
+        
+        validator = RuntimeFileValidator(tmp_path)
+        config = {
+            "web": {"upload_dir": "missing_uploads"},
+            "watch_folder": {"dir": "watch", "processing_dir": "not_a_dir"},
+        }
+        
+        errors, warnings = validator._validate_directory_permissions(config)
+        assert [(e.path, e.code) for e in errors] == [
+            ("web.upload_dir", "directory-not-found"),
+            ("watch_folder.processing_dir", "path-not-directory"),
+        ]
+
     def test_validate_directory_permissions_watch_folder_dir(self, tmp_path: Path) -> None:
         """Test validation of watch folder directory."""
         watch_dir = tmp_path / "watch"
@@ -350,9 +410,10 @@ class TestCSVFileValidation:
     """Tests for CSV file structure validation."""
 
     def test_validate_csv_files_no_pandas(self, tmp_path: Path, monkeypatch) -> None:
-        """Test validation when pandas is not available."""
-        # Mock pandas as unavailable
+        """Test validation when neither pyarrow nor pandas is available."""
+        # Mock both CSV backends as unavailable
         monkeypatch.setattr("tools.config_check.runtime_file_validator.PANDAS_AVAILABLE", False)
+        monkeypatch.setattr("tools.config_check.runtime_file_validator.PYARROW_AVAILABLE", False)
         
         validator = RuntimeFileValidator(tmp_path)
         config = {
@@ -397,6 +458,97 @@ class TestCSVFileValidation:
         assert len(errors) == 0
         assert len(warnings) == 0
 
+    def test_validate_csv_files_reuses_cached_schema(self, tmp_path: Path, monkeypatch) -> None:
+        """Test an unchanged CSV is not parsed again while a changed one is."""
+        csv_file = tmp_path / "reference.csv"
+        csv_file.write_text("column1,update_field\nvalue1,value2\n", encoding="utf-8")
+        config = {
+            "tasks": {
+                "update_reference": {
+                    "module": "standard_step.rules.update_reference",
+                    "params": {"reference_file": "reference.csv", "update_field": "update_field"}
+                }
+            }
+        }
+
+        errors, warnings = RuntimeFileValidator(tmp_path)._validate_csv_files(config)
+        assert errors == [] and warnings == []
+
+        def fail_read(file_path: Path):
+            raise AssertionError(f"unexpected parse of {file_path}")
+
+        with monkeypatch.context() as patched:
+            patched.setattr("tools.config_check.runtime_file_validator._read_csv_head", fail_read)
+            errors, warnings = RuntimeFileValidator(tmp_path)._validate_csv_files(config)
+        assert errors == [] and warnings == []
+
+        csv_file.write_text("column1,other_field\nvalue1,value2\n", encoding="utf-8")
+        os.utime(csv_file, ns=(0, 0))
+        errors, warnings = RuntimeFileValidator(tmp_path)._validate_csv_files(config)
+        assert len(errors) == 1
+        assert errors[0].code == "csv-missing-column"
+
+    def test_validate_csv_files_without_rules_tasks_skips_backend(self, tmp_path: Path, monkeypatch) -> None:
+        """Test configs without rules tasks never load a CSV backend."""
+        def fail_backend():
+            raise AssertionError("CSV backend loaded without rules tasks")
+
+        monkeypatch.setattr("tools.config_check.runtime_file_validator._csv_backend", fail_backend)
+        monkeypatch.setattr("tools.config_check.runtime_file_validator._read_csv_head", fail_backend)
+        config = {
+            "tasks": {
+                "store_json": {
+                    "module": "standard_step.storage.store_metadata_as_json",
+                    "params": {"reference_file": "reference.csv"}
+                }
+            }
+        }
+
+        result = validate_runtime_files(config, tmp_path)
+        assert result.errors == [] and result.warnings == []
+
+    def test_validate_csv_files_cache_can_be_disabled(
+        self, tmp_path: Path, monkeypatch, csv_schema_cache_dir: Path
+    ) -> None:
+        """Test use_cache=False and CONFIG_CHECK_NO_CACHE leave the schema cache untouched."""
+        (tmp_path / "reference.csv").write_text("column1\nvalue1\n", encoding="utf-8")
+        config = {
+            "tasks": {
+                "update_reference": {
+                    "module": "standard_step.rules.update_reference",
+                    "params": {"reference_file": "reference.csv"}
+                }
+            }
+        }
+
+        validate_runtime_files(config, tmp_path, use_cache=False)
+        monkeypatch.setenv("CONFIG_CHECK_NO_CACHE", "1")
+        validate_runtime_files(config, tmp_path)
+        assert list(csv_schema_cache_dir.iterdir()) == []
+
+        monkeypatch.setenv("CONFIG_CHECK_NO_CACHE", "0")
+        validate_runtime_files(config, tmp_path)
+        assert len(list(csv_schema_cache_dir.glob("*.json"))) == 1
+
+    def test_validate_csv_files_cache_is_bounded(
+        self, tmp_path: Path, monkeypatch, csv_schema_cache_dir: Path
+    ) -> None:
+        """Test the schema cache is emptied once it reaches its entry limit."""
+        monkeypatch.setattr("tools.config_check.runtime_file_validator._CSV_SCHEMA_CACHE_LIMIT", 2)
+        for index in range(3):
+            (tmp_path / f"reference{index}.csv").write_text("column1\nvalue1\n", encoding="utf-8")
+            config = {
+                "tasks": {
+                    "update_reference": {
+                        "module": "standard_step.rules.update_reference",
+                        "params": {"reference_file": f"reference{index}.csv"}
+                    }
+                }
+            }
+            validate_runtime_files(config, tmp_path)
+
+        assert len(list(csv_schema_cache_dir.glob("*.json"))) == 1
+
     def test_validate_csv_files_empty_csv(self, tmp_path: Path) -> None:
         """Test validation reports empty CSV files."""
         csv_file = tmp_path / "empty.csv"
@@ -417,6 +569,89 @@ class TestCSVFileValidation:
         assert errors[0].code == "csv-invalid-format"
         assert "no data or invalid format" in errors[0].message
 
+    def test_validate_csv_files_pyarrow_backend(self, tmp_path: Path, monkeypatch) -> None:
+        """Test the pyarrow reader supplies columns and empty files are never opened."""
+        (tmp_path / "reference.csv").write_text("column1\nvalue1\n", encoding="utf-8")
+        (tmp_path / "empty.csv").write_text("", encoding="utf-8")
+        opened: list[str] = []
+
+        class FakeReader:
+            schema = SimpleNamespace(names=["column1", "column2"])
+
+            def __iter__(self):
+                return iter([SimpleNamespace(num_rows=1)])
+
+            def close(self) -> None:
+                pass
+
+        def open_csv_reader(file_name: str) -> FakeReader:
+            opened.append(Path(file_name).name)
+            return FakeReader()
+
+        monkeypatch.setattr("tools.config_check.runtime_file_validator.PYARROW_AVAILABLE", True)
+        monkeypatch.setattr(
+            "tools.config_check.runtime_file_validator._load_pyarrow_csv",
+            lambda: SimpleNamespace(open_csv=open_csv_reader),
+        )
+        validator = RuntimeFileValidator(tmp_path)
+        config = {
+            "tasks": {
+                "update_reference": {
+                    "module": "standard_step.rules.update_reference",
+                    "params": {"reference_file": "reference.csv", "update_field": "column3"}
+                },
+                "update_empty": {
+                    "module": "standard_step.rules.update_reference",
+                    "params": {"reference_file": "empty.csv"}
+                }
+            }
+        }
+
+        result = validator.validate_file_dependencies(config)
+        assert opened == ["reference.csv"]
+        assert [(e.path, e.code) for e in result.errors] == [
+            ("tasks.update_reference.params.update_field", "csv-missing-column"),
+            ("tasks.update_empty.params.reference_file", "csv-invalid-format"),
+        ]
+        assert "column1, column2" in result.errors[0].message
+
+    @pytest.mark.parametrize("use_pyarrow", [True, False])
+    def test_validate_csv_files_whitespace_only_csv(self, tmp_path: Path, monkeypatch, use_pyarrow: bool) -> None:
+        """Test a whitespace-only CSV gets the same code from either backend."""
+        (tmp_path / "blank.csv").write_text("  \n\n \t\n", encoding="utf-8")
+        (tmp_path / "broken.csv").write_text("a,b\n1,2,3\n", encoding="utf-8")
+
+        def open_csv(file_name: str):
+            # pyarrow raises ArrowInvalid, a ValueError, for both files
+            if Path(file_name).name == "blank.csv":
+                raise ValueError("Empty CSV file or block: cannot infer number of columns")
+            raise ValueError("CSV parse error: Expected 2 columns, got 3")
+
+        monkeypatch.setattr("tools.config_check.runtime_file_validator.PYARROW_AVAILABLE", use_pyarrow)
+        monkeypatch.setattr(
+            "tools.config_check.runtime_file_validator._load_pyarrow_csv",
+            lambda: SimpleNamespace(open_csv=open_csv),
+        )
+        validator = RuntimeFileValidator(tmp_path)
+        config = {
+            "tasks": {
+                "update_blank": {
+                    "module": "standard_step.rules.update_reference",
+                    "params": {"reference_file": "blank.csv"}
+                },
+                "update_broken": {
+                    "module": "standard_step.rules.update_reference",
+                    "params": {"reference_file": "broken.csv"}
+                }
+            }
+        }
+
+        errors, warnings = validator._validate_csv_files(config)
+        codes = {error.path: error.code for error in errors}
+        assert codes["tasks.update_blank.params.reference_file"] == "csv-invalid-format"
+        if use_pyarrow:
+            assert codes["tasks.update_broken.params.reference_file"] == "csv-parse-error"
+
     def test_validate_csv_files_missing_update_field(self, tmp_path: Path) -> None:
         """Test validation reports missing update field in CSV."""
         csv_file = tmp_path / "reference.csv"
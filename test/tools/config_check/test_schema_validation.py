@@ -49,7 +49,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tools"))
 
-from tools.config_check.schema import validate_config_against_schema
+from tools.config_check.schema import load_config_schema, validate_config_against_schema
 
 
 def _build_minimal_config() -> dict:
@@ -428,3 +428,11 @@ def test_whitespace_only_processing_dir_reports_error():
         issue.path == "watch_folder.processing_dir" and "non-empty string" in issue.message
         for issue in result.errors
     )
+
+
+def test_load_config_schema_returns_independent_copies():
+    """Test that mutating a returned schema does not affect later calls."""
+    schema = load_config_schema()
+    schema["$defs"].clear()
+
+    assert load_config_schema()["$defs"]
@@ -51,6 +51,7 @@ import sys
 import tempfile
 from pathlib import Path
 from types import ModuleType
+from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tools"))
 
@@ -368,6 +369,44 @@ def test_import_checks_successful_multiple_tasks():
     assert result.errors == []
 
 
+def test_import_checks_import_shared_module_once():
+    """Test that tasks sharing a module import it only once per run."""
+    config = _base_config()
+
+    module = ModuleType("shared_task_module")
+    setattr(module, "FirstTask", type("FirstTask", (), {}))
+    setattr(module, "SecondTask", type("SecondTask", (), {}))
+    sys.modules[module.__name__] = module
+    config["tasks"]["step_one"] = {"module": module.__name__, "class": "FirstTask", "params": {}}
+    config["tasks"]["step_two"] = {"module": module.__name__, "class": "SecondTask", "params": {}}
+    config["pipeline"] = ["step_one", "step_two"]
+
+    try:
+        with patch("importlib.import_module", wraps=importlib.import_module) as import_module:
+            result = validate_tasks(config, import_checks=True)
+    finally:
+        sys.modules.pop(module.__name__, None)
+
+    assert result.errors == []
+    import_module.assert_called_once_with(module.__name__)
+
+
+def test_import_checks_missing_module_attempted_once():
+    """Test that a missing module shared by tasks is reported for each without re-importing."""
+    config = _base_config()
+    config["tasks"]["step_one"]["module"] = "nonexistent.module"
+    config["tasks"]["step_two"] = {"module": "nonexistent.module", "class": "OtherTask", "params": {}}
+    config["pipeline"] = ["step_one", "step_two"]
+
+    with patch("importlib.import_module", wraps=importlib.import_module) as import_module:
+        result = validate_tasks(config, import_checks=True)
+
+    module_errors = [issue for issue in result.errors if issue.code == "task-import-module-not-found"]
+    assert [issue.path for issue in module_errors] == ["tasks.step_one.module", "tasks.step_two.module"]
+    assert module_errors[0].message == module_errors[1].message
+    import_module.assert_called_once_with("nonexistent.module")
+
+
 def test_import_checks_invalid_task_structure_skips_import():
     """Test that tasks with invalid structure skip import validation."""
     config = _base_config()
@@ -70,6 +70,42 @@ class TestYAMLParser:
         error_lower = error.lower()
         assert "line" in error_lower or "column" in error_lower or "could not" in error_lower
 
+    def test_duplicate_key_rejected(self):
+        """Test a repeated mapping key is an error rather than a silent overwrite."""
+        parser = YAMLParser()
+
+        duplicate_yaml = """
+        tasks:
+          a: 1
+          a: 2
+        """
+
+        data, error = parser.loads(duplicate_yaml, source="test_duplicate")
+
+        assert data is None, "Expected None data for duplicate keys"
+        assert error is not None, "Expected error message for duplicate keys"
+        assert "duplicate key" in error.lower()
+        assert "line 4" in error
+
+    def test_merge_key_override_allowed(self):
+        """Test overriding a key brought in by a YAML merge is not a duplicate."""
+        parser = YAMLParser()
+
+        merge_yaml = """
+        defaults: &defaults
+          retries: 1
+          timeout: 5
+        task:
+          <<: *defaults
+          retries: 3
+        """
+
+        data, error = parser.loads(merge_yaml, source="test_merge")
+
+        assert error is None, f"Expected no error, got: {error}"
+        assert data is not None
+        assert data["task"] == {"retries": 3, "timeout": 5}
+
     def test_root_not_mapping(self):
         """Test that YAML with non-mapping root reports error."""
         parser = YAMLParser()
@@ -155,7 +191,7 @@ class TestYAMLParser:
 
         dummy_mapping = DummyMapping({'web': {'upload_dir': './web_upload'}})
 
-        with patch('yaml.safe_load', return_value=dummy_mapping):
+        with patch('tools.config_check.yaml_parser._pyyaml_safe_load', return_value=dummy_mapping):
             data, error = parser.loads('ignored: value', source='test_mapping')
 
         assert error is None, f"Expected no error, got: {error}"
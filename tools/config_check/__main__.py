@@ -170,6 +170,12 @@ Exit Codes:
         help='Output format for validation results (default: text)'
     )
 
+    validate_parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Indent JSON output for readability (default: compact JSON)'
+    )
+
     validate_parser.add_argument(
         '--strict', '-s',
         action='store_true',
@@ -193,6 +199,13 @@ Exit Codes:
         help='Enable runtime file system validation (check file existence, permissions, CSV structure)'
     )
 
+    validate_parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the per-user CSV schema cache used by --check-files '
+             '(also set by CONFIG_CHECK_NO_CACHE=1)'
+    )
+
     validate_parser.add_argument(
         '--performance-analysis',
         action='store_true',
@@ -283,6 +296,7 @@ def run_validate_command(args, logger: logging.Logger) -> int:
         base_dir=args.base_dir,
         import_checks=args.import_checks,
         check_files=args.check_files,
+        file_cache=not args.no_cache,
         performance_analysis=args.performance_analysis,
         security_analysis=args.security_analysis,
     )
@@ -302,7 +316,8 @@ def run_validate_command(args, logger: logging.Logger) -> int:
     # Create reporter based on format choice
     reporter = ValidationReporter(
         output_format=args.format,
-        show_suggestions=True  # Enable suggestions for CLI output
+        show_suggestions=True,  # Enable suggestions for CLI output
+        pretty=args.pretty
     )
 
     # Add validation results to reporter
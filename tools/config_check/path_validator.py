@@ -23,6 +23,10 @@ Classes:
     PathValidationResult: Aggregated result containing all path validation findings
     PathValidator: Main validation engine with Windows-specific path handling
 
+Functions:
+    is_missing_path_error: Classify OS errors that mean a path does not exist,
+        shared with the security and runtime file validators
+
 Windows Compatibility:
     - Proper handling of Windows path separators (\\ and /)
     - Case-insensitive path comparisons where appropriate
@@ -38,10 +42,20 @@ Note:
 
 from __future__ import annotations
 
+import errno
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# OS errors that mean "no such path", as treated by Path.exists() and is_dir()
+_MISSING_PATH_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+_MISSING_PATH_WINERRORS = frozenset({21, 123, 1921})
+
+
+def is_missing_path_error(exc: OSError) -> bool:
+    """Return whether an OS error from a stat call means the path does not exist."""
+    return exc.errno in _MISSING_PATH_ERRNOS or getattr(exc, "winerror", None) in _MISSING_PATH_WINERRORS
 
 
 @dataclass(slots=True)
@@ -68,6 +82,8 @@ class PathValidator:
     STATIC_DIR_KEYS = ("web.upload_dir",)
     WATCH_DIR_KEY = "watch_folder.dir"
     PROCESSING_DIR_KEY = "watch_folder.processing_dir"
+    # Keys validated by dedicated checks, skipped by the dynamic walk
+    DEDICATED_KEYS = frozenset({WATCH_DIR_KEY, PROCESSING_DIR_KEY, *STATIC_DIR_KEYS})
 
     def __init__(self, base_dir: Optional[Path] = None) -> None:
         self.base_dir = Path(base_dir) if base_dir else None
@@ -143,27 +159,33 @@ class PathValidator:
 
     def _validate_dynamic_paths(self, config: Dict[str, Any]) -> List[PathIssue]:
         findings: List[PathIssue] = []
+        dedicated_keys = self.DEDICATED_KEYS
+
+        # Depth-first in document order: each mapping key is checked before its
+        # own children, which are pushed in reverse so they pop in order
+        stack: List[Tuple[bool, Any, Any, str]] = [(False, None, config, "")]
+        while stack:
+            is_entry, key, node, current = stack.pop()
+            if is_entry:
+                lowered_key = key.lower()
+                if current in dedicated_keys:
+                    # Already handled by dedicated checks
+                    pass
+                elif lowered_key.endswith("_dir"):
+                    findings.extend(self._validate_directory_value(node, current))
+                elif lowered_key.endswith("_file"):
+                    findings.extend(self._validate_file_value(node, current))
 
-        def _walk(node: Any, trace: str = "") -> None:
             if isinstance(node, dict):
-                for key, value in node.items():
-                    current = f"{trace}.{key}".lstrip(".")
-                    lowered_key = key.lower()
-                    if current in {self.WATCH_DIR_KEY, self.PROCESSING_DIR_KEY, *self.STATIC_DIR_KEYS}:
-                        # Already handled by dedicated checks
-                        pass
-                    elif lowered_key.endswith("_dir"):
-                        findings.extend(self._validate_directory_value(value, current))
-                    elif lowered_key.endswith("_file"):
-                        findings.extend(self._validate_file_value(value, current))
-
-                    if isinstance(value, (dict, list)):
-                        _walk(value, current)
+                stack.extend(reversed([
+                    (True, child_key, value, f"{current}.{child_key}".lstrip("."))
+                    for child_key, value in node.items()
+                ]))
             elif isinstance(node, list):
-                for index, item in enumerate(node):
-                    _walk(item, f"{trace}[{index}]")
+                stack.extend(reversed([
+                    (False, None, item, f"{current}[{index}]") for index, item in enumerate(node)
+                ]))
 
-        _walk(config)
         return findings
 
     def _validate_directory_value(
@@ -22,6 +22,7 @@ Key Features:
 Classes:
     PipelineIssue: Represents a single pipeline validation finding with error code
     PipelineValidationResult: Aggregated result containing all pipeline validation findings
+    TaskMetadata: Per-config snapshot of task classifications, fields, and token usage
 
 Constants:
     TOKEN_PATTERN: Regex pattern for extracting template tokens from strings
@@ -117,6 +118,19 @@ class PipelineValidationResult:
     warnings: List[PipelineIssue]
 
 
+@dataclass(slots=True)
+class TaskMetadata:
+    """Per-config snapshot of task classifications, fields, and token usage."""
+
+    known_fields: Set[str]
+    token_usages: List[TokenUsage]
+    per_task_tokens: Dict[str, Set[str]]
+    classifications: Dict[str, Optional[str]]
+    metadata_producers: Set[str]
+    module_names: Dict[str, Optional[str]]
+    scalar_fields: Set[str]
+    table_fields: Set[str]
+
 
 def validate_pipeline(config: Dict[str, Any]) -> PipelineValidationResult:
     """Validate pipeline ordering, dependencies, and token usage."""
@@ -177,14 +191,14 @@ def validate_pipeline(config: Dict[str, Any]) -> PipelineValidationResult:
                 )
 
     metadata = _build_task_metadata(tasks)
-    known_field_tokens: Set[str] = metadata["known_fields"]
-    token_usages = metadata["tokens_by_path"]
-    per_task_tokens = metadata["per_task_tokens"]
-    classifications = metadata["classifications"]
-    metadata_producers = metadata.get("metadata_producers", set())
-    module_names = metadata.get("module_names", {})
-    scalar_field_tokens: Set[str] = metadata.get("scalar_fields", set())
-    table_field_tokens: Set[str] = metadata.get("table_fields", set())
+    known_field_tokens = metadata.known_fields
+    token_usages = metadata.token_usages
+    per_task_tokens = metadata.per_task_tokens
+    classifications = metadata.classifications
+    metadata_producers = metadata.metadata_producers
+    module_names = metadata.module_names
+    scalar_field_tokens = metadata.scalar_fields
+    table_field_tokens = metadata.table_fields
 
     allowed_tokens = known_field_tokens | KNOWN_CONTEXT_TOKENS
 
@@ -334,7 +348,7 @@ def validate_pipeline(config: Dict[str, Any]) -> PipelineValidationResult:
 
 
 
-def _build_task_metadata(tasks: Dict[str, Any]) -> Dict[str, Any]:
+def _build_task_metadata(tasks: Dict[str, Any]) -> TaskMetadata:
     known_fields: Set[str] = set()
     token_usages: List[TokenUsage] = []
     per_task_tokens: Dict[str, Set[str]] = {}
@@ -368,12 +382,10 @@ def _build_task_metadata(tasks: Dict[str, Any]) -> Dict[str, Any]:
             if isinstance(fields, dict):
                 if fields:
                     metadata_producers.add(task_name)
-                for field_name, spec in fields.items():
-                    known_fields.add(field_name)
-                    if _is_table_field(spec):
-                        table_fields.add(field_name)
-                    else:
-                        scalar_fields.add(field_name)
+                task_table = {name for name, spec in fields.items() if _is_table_field(spec)}
+                known_fields.update(fields)
+                table_fields |= task_table
+                scalar_fields.update(fields.keys() - task_table)
 
         task_tokens: Set[str] = set()
         for string_path, value in _iter_string_values(params, f"tasks.{task_name}.params"):
@@ -410,16 +422,16 @@ def _build_task_metadata(tasks: Dict[str, Any]) -> Dict[str, Any]:
 
         per_task_tokens[task_name] = task_tokens
 
-    return {
-        "known_fields": known_fields,
-        "tokens_by_path": token_usages,
-        "per_task_tokens": per_task_tokens,
-        "classifications": classifications,
-        "metadata_producers": metadata_producers,
-        "module_names": module_names,
-        "scalar_fields": scalar_fields,
-        "table_fields": table_fields,
-    }
+    return TaskMetadata(
+        known_fields=known_fields,
+        token_usages=token_usages,
+        per_task_tokens=per_task_tokens,
+        classifications=classifications,
+        metadata_producers=metadata_producers,
+        module_names=module_names,
+        scalar_fields=scalar_fields,
+        table_fields=table_fields,
+    )
 
 
 def _classify_task(module_name: Optional[str], class_name: Optional[str] = None) -> Optional[str]:
@@ -444,7 +456,10 @@ def _is_storage_filename_path(task_name: str, path: str) -> bool:
 
 
 def _is_table_field(spec: Any) -> bool:
-    return isinstance(spec, dict) and spec.get("is_table") is True
+    try:
+        return spec.get("is_table") is True
+    except AttributeError:
+        return False
 
 
 def _is_table_storage_module(module_name: Optional[str]) -> bool:
@@ -454,16 +469,21 @@ def _is_table_storage_module(module_name: Optional[str]) -> bool:
 
 
 def _iter_string_values(node: Any, base_path: str) -> Iterable[Tuple[str, str]]:
-    if isinstance(node, str):
-        yield base_path, node
-    elif isinstance(node, dict):
-        for key, value in node.items():
-            next_path = f"{base_path}.{key}" if base_path else key
-            yield from _iter_string_values(value, next_path)
-    elif isinstance(node, list):
-        for index, value in enumerate(node):
-            next_path = f"{base_path}[{index}]" if base_path else f"[{index}]"
-            yield from _iter_string_values(value, next_path)
+    # Walk with an explicit stack, children pushed in reverse so strings come
+    # out in document order without passing through one generator per level
+    stack: List[Tuple[Any, str]] = [(node, base_path)]
+    while stack:
+        node, path = stack.pop()
+        if isinstance(node, str):
+            yield path, node
+        elif isinstance(node, dict):
+            stack.extend(reversed([
+                (value, f"{path}.{key}" if path else key) for key, value in node.items()
+            ]))
+        elif isinstance(node, list):
+            stack.extend(reversed([
+                (value, f"{path}[{index}]" if path else f"[{index}]") for index, value in enumerate(node)
+            ]))
 
 
 def _extract_tokens(value: str) -> Set[str]:
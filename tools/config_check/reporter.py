@@ -50,16 +50,21 @@ from __future__ import annotations
 import json
 import sys
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TextIO
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
 
 
-class FindingLevel(Enum):
-    """Categorization levels for validation findings."""
-    ERROR = "ERROR"
-    WARNING = "WARNING"
-    INFO = "INFO"
+class FindingLevel(IntEnum):
+    """Categorization levels for validation findings.
+
+    Values are ordinals ordered by severity so they can index per-level
+    buckets directly; ``.name`` provides the display label.
+    """
+    ERROR = 0
+    WARNING = 1
+    INFO = 2
 
 
 @dataclass(slots=True)
@@ -85,14 +90,106 @@ class Finding:
     """Path to the configuration file where the finding was detected"""
 
 
+_COMPACT_SEPARATORS = (",", ":")
+
+_LEVEL_ORDER = (FindingLevel.ERROR, FindingLevel.WARNING, FindingLevel.INFO)
+
+_EMPTY_JSON_REPORT_DATA: Dict[str, Any] = {
+    "status": "valid",
+    "summary": {"total": 0, "errors": 0, "warnings": 0, "info": 0},
+    "exit_code": 0,
+    "findings": [],
+}
+
+# Rendered no-findings JSON report keyed by the ``pretty`` flag.
+_EMPTY_JSON_REPORTS = {
+    False: json.dumps(_EMPTY_JSON_REPORT_DATA, separators=_COMPACT_SEPARATORS),
+    True: json.dumps(_EMPTY_JSON_REPORT_DATA, indent=2),
+}
+
+# Display label per level, indexed by FindingLevel ordinal. Plain strings
+# avoid the Enum ``.name`` descriptor on per-finding paths.
+_LEVEL_LABELS = tuple(level.name for level in FindingLevel)
+
+# Per-finding text line prefix ("  [ERROR] "), indexed by FindingLevel ordinal.
+_LEVEL_LINE_PREFIXES = tuple(f"  [{label}] " for label in _LEVEL_LABELS)
+
+# Section heading and underline per level, indexed by FindingLevel ordinal.
+_LEVEL_HEADINGS = tuple(
+    (f"{label}S:", "=" * len(f"{label}S:")) for label in _LEVEL_LABELS
+)
+
+
+def _finding_to_dict(finding: Finding, show_suggestions: bool) -> Dict[str, Any]:
+    finding_dict = {
+        "path": finding.path,
+        "level": _LEVEL_LABELS[finding.level],
+        "message": finding.message,
+        "code": finding.code,
+        "config_path": finding.config_path
+    }
+    if show_suggestions and finding.suggestion:
+        finding_dict["suggestion"] = finding.suggestion
+    return finding_dict
+
+
+def _declares_optional_fields(issues: List[Any]) -> bool:
+    """Return True when every issue's class defines ``suggestion`` and ``code``.
+
+    Class-level attributes (such as dataclass defaults) guarantee plain
+    attribute access succeeds, so callers can skip per-item ``getattr``.
+    """
+    return all(
+        hasattr(issue_type, "suggestion") and hasattr(issue_type, "code")
+        for issue_type in set(map(type, issues))
+    )
+
+
+_SUGGESTION_AND_CODE = attrgetter("suggestion", "code")
+
+
+def _suggestion_and_code_or_none(issue: Any) -> Tuple[Optional[str], Optional[str]]:
+    """Read ``suggestion`` and ``code`` from issues that may lack them."""
+    return getattr(issue, "suggestion", None), getattr(issue, "code", None)
+
+
+def _format_summary(errors: int, warnings: int, info: int) -> str:
+    outcome = "failed" if errors else "passed"
+    return (
+        f"Validation {outcome} with "
+        f"{_plural(errors, 'error')}, "
+        f"{_plural(warnings, 'warning')}, "
+        f"{_plural(info, 'info message')}."
+    )
+
+
+def _plural(count: int, noun: str) -> str:
+    suffix = "" if count == 1 else "s"
+    return f"{count} {noun}{suffix}"
+
+
 class ValidationReporter:
     """Handles structured output formatting for validation results."""
 
+    __slots__ = (
+        "output_format",
+        "output_file",
+        "show_suggestions",
+        "pretty",
+        "_findings",
+        "_grouped_cache",
+        "_counts",
+        "_report_cache",
+        "_report_cache_key",
+        "_text_pool",
+    )
+
     def __init__(
         self,
         output_format: str = "text",
         output_file: Optional[TextIO] = None,
-        show_suggestions: bool = True
+        show_suggestions: bool = True,
+        pretty: bool = False
     ) -> None:
         """
         Initialize the validation reporter.
@@ -101,11 +198,28 @@ class ValidationReporter:
             output_format: Output format ('text' or 'json')
             output_file: Optional file to write output to (defaults to stdout)
             show_suggestions: Whether to include suggestions in output
+            pretty: Indent JSON output; compact JSON is emitted by default
         """
         self.output_format = output_format
         self.output_file = output_file or sys.stdout
         self.show_suggestions = show_suggestions
-        self.findings: List[Finding] = []
+        self.pretty = pretty
+        self._findings: List[Finding] = []
+        self._grouped_cache: Optional[List[List[Finding]]] = None
+        self._counts = [0, 0, 0]
+        self._report_cache: Optional[str] = None
+        self._report_cache_key: Optional[tuple] = None
+        # Shares one string object per distinct message/suggestion/code.
+        self._text_pool: Dict[str, str] = {}
+
+    @property
+    def findings(self) -> Tuple[Finding, ...]:
+        """Findings in report order, as a read-only snapshot.
+
+        Findings are only changed through ``add_*``, ``sort_findings`` and
+        ``clear_findings`` so the cached counts and grouping stay in sync.
+        """
+        return tuple(self._findings)
 
     def add_finding(
         self,
@@ -127,15 +241,19 @@ class ValidationReporter:
             code: Optional error code
             config_path: Optional path to config file
         """
+        pooled = self._text_pool.setdefault
         finding = Finding(
             path=path,
             level=level,
-            message=message,
-            suggestion=suggestion,
-            code=code,
+            message=pooled(message, message),
+            suggestion=None if suggestion is None else pooled(suggestion, suggestion),
+            code=None if code is None else pooled(code, code),
             config_path=config_path
         )
-        self.findings.append(finding)
+        self._findings.append(finding)
+        self._grouped_cache = None
+        self._report_cache = None
+        self._counts[level] += 1
 
     def add_validation_result(self, result, config_path: Optional[str] = None) -> None:
         """
@@ -145,97 +263,133 @@ class ValidationReporter:
             result: ValidationResult object with errors and warnings
             config_path: Path to the configuration file
         """
-        # Add errors as ERROR level findings
-        for error in result.errors:
-            self.add_finding(
-                path=error.path,
-                level=FindingLevel.ERROR,
-                message=error.message,
-                suggestion=getattr(error, "suggestion", None),
-                code=getattr(error, "code", None),
-                config_path=config_path
-            )
-
-        # Add warnings as WARNING level findings
-        for warning in result.warnings:
-            self.add_finding(
-                path=warning.path,
-                level=FindingLevel.WARNING,
-                message=warning.message,
-                suggestion=getattr(warning, "suggestion", None),
-                code=getattr(warning, "code", None),
-                config_path=config_path
-            )
+        errors = result.errors
+        warnings = result.warnings
+        if not errors and not warnings:
+            return
+
+        append = self._findings.append
+        pooled = self._text_pool.setdefault
+        for level, issues in ((FindingLevel.ERROR, errors), (FindingLevel.WARNING, warnings)):
+            if _declares_optional_fields(issues):
+                # e.g. ValidationMessage: suggestion/code always resolve
+                optional_fields = _SUGGESTION_AND_CODE
+            else:
+                optional_fields = _suggestion_and_code_or_none
+            for issue in issues:
+                message = issue.message
+                suggestion, code = optional_fields(issue)
+                append(
+                    Finding(
+                        path=issue.path,
+                        level=level,
+                        message=pooled(message, message),
+                        suggestion=None if suggestion is None else pooled(suggestion, suggestion),
+                        code=None if code is None else pooled(code, code),
+                        config_path=config_path
+                    )
+                )
+            self._counts[level] += len(issues)
+
+        self._grouped_cache = None
+        self._report_cache = None
 
     def generate_report(self) -> str:
         """
         Generate the complete validation report.
 
+        The rendered report is cached until the output settings change or a
+        finding mutator (``add_*``, ``sort_findings``, ``clear_findings``)
+        drops it, so repeated calls are cheap.
+
         Returns:
             Formatted report string
         """
+        cache_key = (self.output_format, self.show_suggestions, self.pretty)
+        if self._report_cache is not None and self._report_cache_key == cache_key:
+            return self._report_cache
+
         if self.output_format == "json":
-            return self._generate_json_report()
+            report = self._generate_json_report()
         else:
-            return self._generate_text_report()
+            report = self._generate_text_report()
+
+        self._report_cache = report
+        self._report_cache_key = cache_key
+        return report
 
     def _generate_text_report(self) -> str:
         """Generate human-readable text report."""
-        if not self.findings:
-            return "Validation passed with no issues found.\n"
+        return "\n".join(self._iter_text_report_lines())
+
+    def _iter_text_report_lines(self) -> Iterator[str]:
+        """Yield text report lines without trailing newlines."""
+        if not self._findings:
+            yield "Validation passed with no issues found."
+            yield ""
+            return
 
         grouped_findings = self._group_findings_by_level()
-        report_lines: list[str] = []
+        show_suggestions = self.show_suggestions
+        first_section = True
 
-        for level in [FindingLevel.ERROR, FindingLevel.WARNING, FindingLevel.INFO]:
-            findings = grouped_findings.get(level, [])
+        for level in _LEVEL_ORDER:
+            findings = grouped_findings[level]
             if not findings:
                 continue
 
-            if report_lines:
-                report_lines.append("")
+            if not first_section:
+                yield ""
+            first_section = False
 
-            level_name = level.value
-            report_lines.append(f"{level_name}S:")
-            report_lines.append("=" * len(level_name + "S:"))
+            yield from _LEVEL_HEADINGS[level]
+            line_prefix = _LEVEL_LINE_PREFIXES[level]
 
             for finding in findings:
-                report_lines.append(f"  [{level.value}] {finding.path}: {finding.message}")
+                yield f"{line_prefix}{finding.path}: {finding.message}"
 
-                if self.show_suggestions and finding.suggestion:
-                    report_lines.append(f"    Suggestion: {finding.suggestion}")
+                if show_suggestions and finding.suggestion:
+                    yield f"    Suggestion: {finding.suggestion}"
 
-        summary = self.generate_summary()
-        report_lines.append("")
-        report_lines.append(summary)
-
-        return "\n".join(report_lines)
+        yield ""
+        yield _format_summary(*map(len, grouped_findings))
 
     def _generate_json_report(self) -> str:
-        """Generate machine-readable JSON report."""
-        # Group findings by level for summary
-        grouped_findings = self._group_findings_by_level()
+        """Generate machine-readable JSON report.
+
+        Compact output is the default because the stdlib encoder only uses its
+        C implementation when ``indent`` is unset; ``pretty`` opts into
+        two-space indentation.
+        """
+        if not self._findings:
+            return _EMPTY_JSON_REPORTS[self.pretty]
+
+        report_data = self._build_json_report_data()
+        if self.pretty:
+            return json.dumps(report_data, indent=2)
+        return json.dumps(report_data, separators=_COMPACT_SEPARATORS)
+
+    def _build_json_report_data(self) -> Dict[str, Any]:
+        """Build the JSON-serializable report payload."""
+        report_data = self._build_json_envelope()
+        show_suggestions = self.show_suggestions
 
         # Convert findings to dictionaries
-        findings_data = []
-        for finding in self.findings:
-            finding_dict = {
-                "path": finding.path,
-                "level": finding.level.value,
-                "message": finding.message,
-                "code": finding.code,
-                "config_path": finding.config_path
-            }
-            if self.show_suggestions and finding.suggestion:
-                finding_dict["suggestion"] = finding.suggestion
-            findings_data.append(finding_dict)
+        report_data["findings"] = [
+            _finding_to_dict(finding, show_suggestions) for finding in self._findings
+        ]
+        return report_data
+
+    def _build_json_envelope(self) -> Dict[str, Any]:
+        """Build the status, summary, and exit-code part of the JSON report."""
+        errors, warnings, info = self._counts
 
         # Create summary statistics
         summary_stats = {
-            "total": len(self.findings),
-            "errors": len(grouped_findings.get(FindingLevel.ERROR, [])),
-            "warnings": len(grouped_findings.get(FindingLevel.WARNING, [])),
-            "info": len(grouped_findings.get(FindingLevel.INFO, []))
+            "total": len(self._findings),
+            "errors": errors,
+            "warnings": warnings,
+            "info": info
         }
 
         # Determine overall status
@@ -245,65 +399,76 @@ class ValidationReporter:
         elif summary_stats["warnings"] > 0:
             status = "warning"
 
-        # Create complete report
-        report_data = {
+        return {
             "status": status,
             "summary": summary_stats,
             "exit_code": self.determine_exit_code(),
-            "findings": findings_data
         }
 
-        return json.dumps(report_data, indent=2)
+    def _write_json_report(self, stream: TextIO) -> None:
+        """Stream the JSON report one finding at a time.
 
-    def _group_findings_by_level(self) -> Dict[FindingLevel, List[Finding]]:
-        """Group findings by their level for organized reporting."""
-        grouped = {
-            FindingLevel.ERROR: [],
-            FindingLevel.WARNING: [],
-            FindingLevel.INFO: []
-        }
+        The layout is identical to ``_generate_json_report`` but the full
+        findings list is never materialized.
+        """
+        if not self._findings:
+            stream.write(_EMPTY_JSON_REPORTS[self.pretty])
+            return
+
+        if self.pretty:
+            dumps_kwargs: Dict[str, Any] = {"indent": 2}
+            envelope_tail = 2  # "\n}"
+            findings_key = ',\n  "findings": '
+            open_list, separator, close_list = "[\n    ", ",\n    ", "\n  ]"
+            close_object = "\n}"
+        else:
+            dumps_kwargs = {"separators": _COMPACT_SEPARATORS}
+            envelope_tail = 1  # "}"
+            findings_key = ',"findings":'
+            open_list, separator, close_list = "[", ",", "]"
+            close_object = "}"
+
+        envelope = json.dumps(self._build_json_envelope(), **dumps_kwargs)
+        stream.write(envelope[:-envelope_tail])  # reopen the top-level object
+        stream.write(findings_key)
+
+        show_suggestions = self.show_suggestions
+        stream.write(open_list)
+        for index, finding in enumerate(self._findings):
+            if index:
+                stream.write(separator)
+            encoded = json.dumps(_finding_to_dict(finding, show_suggestions), **dumps_kwargs)
+            if self.pretty:
+                encoded = encoded.replace("\n", "\n    ")
+            stream.write(encoded)
+        stream.write(close_list)
+
+        stream.write(close_object)
+
+    def _group_findings_by_level(self) -> List[List[Finding]]:
+        """Group findings by their level for organized reporting.
+
+        The grouping is built in a single pass and cached until the findings
+        change, so report, summary, and exit-code generation share one walk.
+        The result is indexed by ``FindingLevel`` ordinal.
+        """
+        if self._grouped_cache is not None:
+            return self._grouped_cache
 
-        for finding in self.findings:
+        grouped: List[List[Finding]] = [[], [], []]
+
+        for finding in self._findings:
             grouped[finding.level].append(finding)
 
+        self._grouped_cache = grouped
         return grouped
 
     def generate_summary(self) -> str:
         """Generate summary statistics string."""
-        if not self.findings:
+        if not self._findings:
             return "Validation passed with no issues found."
 
-        grouped_findings = self._group_findings_by_level()
-        errors = len(grouped_findings[FindingLevel.ERROR])
-        warnings = len(grouped_findings[FindingLevel.WARNING])
-        info = len(grouped_findings[FindingLevel.INFO])
-
-        def _plural(count: int, noun: str) -> str:
-            suffix = "" if count == 1 else "s"
-            return f"{count} {noun}{suffix}"
-
-        if errors > 0:
-            return (
-                "Validation failed with "
-                f"{_plural(errors, 'error')}, "
-                f"{_plural(warnings, 'warning')}, "
-                f"{_plural(info, 'info message')}."
-            )
-
-        if warnings > 0:
-            return (
-                "Validation passed with "
-                f"{_plural(errors, 'error')}, "
-                f"{_plural(warnings, 'warning')}, "
-                f"{_plural(info, 'info message')}."
-            )
-
-        return (
-            "Validation passed with "
-            f"{_plural(errors, 'error')}, "
-            f"{_plural(warnings, 'warning')}, "
-            f"{_plural(info, 'info message')}."
-        )
+        return _format_summary(*self._counts)
 
     def determine_exit_code(self) -> int:
         """
@@ -312,19 +477,28 @@ class ValidationReporter:
         Returns:
             Exit code: 0=none, 1=errors, 2=warnings-only
         """
-        grouped_findings = self._group_findings_by_level()
-
-        if grouped_findings[FindingLevel.ERROR]:
+        if self._counts[FindingLevel.ERROR]:
             return 1  # Errors found
-        elif grouped_findings[FindingLevel.WARNING]:
+        elif self._counts[FindingLevel.WARNING]:
             return 2  # Warnings only
         else:
             return 0  # No issues
 
     def print_report(self) -> None:
-        """Print the report to the configured output file."""
-        report = self.generate_report()
-        print(report, file=self.output_file)
+        """Write the report to the configured output file.
+
+        Output matches ``print(self.generate_report())`` but is streamed to
+        the file so the full report string is never materialized.
+        """
+        stream = self.output_file
+        if self.output_format == "json":
+            self._write_json_report(stream)
+            stream.write("\n")
+        else:
+            for line in self._iter_text_report_lines():
+                stream.write(line)
+                stream.write("\n")
+        stream.flush()
 
     def has_findings(self, level: Optional[FindingLevel] = None) -> bool:
         """
@@ -337,10 +511,22 @@ class ValidationReporter:
             True if findings exist (for the specified level if provided)
         """
         if level is None:
-            return len(self.findings) > 0
-        else:
-            return any(f.level == level for f in self.findings)
+            return len(self._findings) > 0
+        return self._counts[level] > 0
+
+    def sort_findings(self) -> None:
+        """Order findings by severity (errors first), keeping insertion order within a level.
+
+        ``FindingLevel`` ordinals double as severity ranks, so the sort key is
+        the C-level ``attrgetter`` rather than a Python lambda.
+        """
+        self._findings.sort(key=attrgetter("level"))
+        self._report_cache = None
 
     def clear_findings(self) -> None:
         """Clear all findings from the reporter."""
-        self.findings.clear()
\ No newline at end of file
+        self._findings.clear()
+        self._grouped_cache = None
+        self._report_cache = None
+        self._counts = [0, 0, 0]
+        self._text_pool.clear()
\ No newline at end of file
@@ -4,7 +4,7 @@ This module provides comprehensive validation for rules tasks (update_reference.
 that process CSV files and update reference data based on pipeline context values.
 
 The rules task validator performs specialized validation including:
-- CSV structure validation using pandas to check file accessibility and headers
+- CSV structure validation that reads only the header row to check file accessibility
 - Column existence validation to verify update_field and clause columns exist in CSV
 - Clause uniqueness detection to identify duplicate clauses and potential conflicts
 - Context path validation with proper dotted notation checking
@@ -27,6 +27,7 @@ Classes:
 
 Functions:
     validate_rules_task(): Main validation entry point for rules task configurations
+    reset_cache(): Clear cached CSV headers and the shared per-thread validator
 
 Windows Compatibility:
     - Proper handling of Windows file paths and CSV encoding
@@ -34,27 +35,74 @@ Windows Compatibility:
     - Support for Windows-specific file access patterns
 
 Note:
-    CSV validation requires pandas for file parsing and structure analysis.
-    This validation is designed to catch configuration errors before runtime
-    and provide actionable feedback for troubleshooting.
+    CSV headers are read with the standard library ``csv`` module; pandas is
+    only imported, on first use, as a fallback for files the stdlib reader
+    rejects. This validation is designed to catch configuration errors before
+    runtime and provide actionable feedback for troubleshooting.
 """
 
 from __future__ import annotations
 
+import csv
+import os
 import re
-from dataclasses import dataclass
+import sys
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
-
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    pd = None  # type: ignore[assignment]
-    PANDAS_AVAILABLE = False
+from typing import AbstractSet, Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 from .task_validator import TaskIssue
 
+class _CSVHeaderMissingError(ValueError):
+    """Raised when a reference CSV contains no header row."""
+
+
+# Column-name fragments that suggest numeric content
+_NUMERIC_INDICATORS = frozenset({
+    'amount', 'total', 'price', 'cost', 'value', 'sum', 'count', 'number',
+    'qty', 'quantity', 'rate', 'percent', 'percentage', 'tax', 'fee',
+    'balance', 'credit', 'debit', 'invoice_total', 'subtotal'
+})
+
+# Common extraction field patterns
+_COMMON_FIELD_PATTERNS = frozenset({
+    'invoice', 'date', 'amount', 'total', 'supplier', 'vendor', 'customer',
+    'address', 'phone', 'email', 'number', 'id', 'reference', 'order',
+    'purchase', 'tax', 'description', 'item', 'quantity', 'price', 'cost'
+})
+
+# Generic or system-like names that are unlikely to be real extraction fields
+_UNREALISTIC_FIELD_PATTERNS = frozenset({
+    'test', 'example', 'sample', 'dummy', 'temp', 'tmp', 'debug',
+    'foo', 'bar', 'baz', 'placeholder', 'xxx', 'yyy', 'zzz'
+})
+
+# Finding codes
+_CODE_FILE_NOT_FOUND = "file-not-found"
+_CODE_CSV_EMPTY = "rules-csv-empty"
+_CODE_CSV_MISSING_HEADERS = "rules-csv-missing-headers"
+_CODE_CSV_NOT_READABLE = "rules-csv-not-readable"
+_CODE_COLUMN_NOT_FOUND = "rules-column-not-found"
+_CODE_DUPLICATE_CLAUSE = "rules-duplicate-clause"
+_CODE_IMPOSSIBLE_CONDITION = "rules-impossible-condition"
+_CODE_CONTEXT_REUSE = "rules-context-reuse"
+_CODE_CONTEXT_PATH_INVALID = "rules-context-path-invalid"
+_CODE_FIELD_NOT_FOUND = "rules-field-not-found"
+_CODE_CONTEXT_PATH_ISSUE = "rules-context-path-issue"
+_CODE_DEPRECATED_DATA_PREFIX = "rules-deprecated-data-prefix"
+_CODE_SEMANTIC_TYPE_MISMATCH = "rules-semantic-type-mismatch"
+_CODE_UNREALISTIC_FIELD_REFERENCE = "rules-unrealistic-field-reference"
+
+# Parsed CSV headers keyed by (absolute path, mtime_ns, size); a changed file
+# gets a new key, so entries never go stale. Values are (columns, is_empty).
+_CSV_HEADER_CACHE: Dict[Tuple[str, int, int], Tuple[List[str], bool]] = {}
+
+# Distinct CSV versions remembered before the header cache starts over
+_CSV_HEADER_CACHE_LIMIT = 256
+
 
 @dataclass
 class CSVValidationResult:
@@ -80,9 +128,8 @@ class ContextPathValidator:
     """Validates from_context dotted paths."""
     
     VALID_PATH_PATTERN = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)*$')
-    DEPRECATED_DATA_PREFIX = re.compile(r'^data\.')
     
-    def validate_context_path(self, path: str, available_fields: Optional[List[str]] = None) -> List[str]:
+    def validate_context_path(self, path: str, available_fields: Optional[AbstractSet[str]] = None) -> List[str]:
         """Validate a context path and return any issues."""
         issues = []
         
@@ -91,183 +138,287 @@ class ContextPathValidator:
             issues.append(f"Invalid dotted path syntax: '{path}'")
         
         # Check for deprecated data. prefix
-        if self.DEPRECATED_DATA_PREFIX.match(path):
+        has_data_prefix = path.startswith("data.")
+        if has_data_prefix:
             issues.append(f"Deprecated 'data.' prefix in path: '{path}'. Use bare field name instead.")
         
         # Check if field exists in extraction fields
         if available_fields:
-            clean_path = self.DEPRECATED_DATA_PREFIX.sub('', path)
+            clean_path = path[5:] if has_data_prefix else path
             if clean_path not in available_fields:
                 issues.append(f"Field '{clean_path}' not found in extraction fields")
         
         return issues
 
 
+@dataclass
+class _ClauseFindings:
+    """Per-clause findings collected in one traversal, kept by category for report ordering."""
+    columns: List[TaskIssue] = field(default_factory=list)
+    context_paths: List[TaskIssue] = field(default_factory=list)
+    deprecations: List[TaskIssue] = field(default_factory=list)
+    semantics: List[TaskIssue] = field(default_factory=list)
+
+
+class _ClauseView(NamedTuple):
+    """Fields of a dict clause, read once and shared by every clause check."""
+    index: int
+    column: Any
+    from_context: Any
+    number: Any
+    signature: Tuple[Any, Any, Any]
+
+
+def _build_clause_views(clauses: List[Any]) -> Tuple[_ClauseView, ...]:
+    """Drop non-dict clauses and extract the fields the checks read."""
+    views = []
+    for i, clause in enumerate(clauses):
+        if not isinstance(clause, dict):
+            continue
+        column = clause.get("column")
+        from_context = clause.get("from_context")
+        number = clause.get("number")
+        # Signature for exact duplicate detection; a missing flag counts as False
+        signature = (column, from_context, number if "number" in clause else False)
+        views.append(_ClauseView(i, column, from_context, number, signature))
+    return tuple(views)
+
+
+# ContextPathValidator holds no per-call state, so every validator shares one.
+_CTX_VALIDATOR = ContextPathValidator()
+
+
 class RulesTaskValidator:
     """Specialized validator for rules task configurations."""
     
     def __init__(self):
-        self.context_validator = ContextPathValidator()
+        self.context_validator = _CTX_VALIDATOR
         self._csv_columns: Dict[str, List[str]] = {}
     
     def validate_rules_task(self, task_name: str, task_config: Dict[str, Any], 
                           extraction_fields: Optional[Dict[str, Any]] = None) -> List[TaskIssue]:
         """Comprehensive validation of rules task configuration."""
-        findings: List[TaskIssue] = []
-        
-        # CSV structure validation
-        findings.extend(self._validate_csv_structure(task_name, task_config))
-        
-        # Column existence validation
-        findings.extend(self._validate_column_existence(task_name, task_config))
+        # Every finding path embeds the task name; YAML may also yield non-string keys
+        if isinstance(task_name, str):
+            task_name = sys.intern(task_name)
         
-        # Clause uniqueness validation
-        findings.extend(self._validate_clause_uniqueness(task_name, task_config))
+        # Columns from a previous config that reused this task name are stale
+        self._csv_columns.pop(task_name, None)
         
-        # Context path validation
-        findings.extend(self._validate_context_paths(task_name, task_config, extraction_fields))
-        
-        # Deprecation warnings
-        findings.extend(self._check_deprecation_warnings(task_name, task_config))
-        
-        # Semantic validation
-        findings.extend(self._validate_semantic_issues(task_name, task_config, extraction_fields))
+        params = task_config.get("params", {})
+        reference_file = params.get("reference_file")
         
-        return findings
+        # A csv_match that is not a dictionary is reported by the schema validator
+        csv_match = params.get("csv_match", {})
+        clauses = _build_clause_views(csv_match.get("clauses", [])) if isinstance(csv_match, dict) else ()
+        
+        # CSV structure validation runs first because it records the columns the
+        # later checks read; without a reference file there are no columns to check
+        csv_findings = self._validate_csv_structure(task_name, reference_file) if reference_file else []
+        
+        # Per-clause checks share a single traversal of the clauses
+        clause_findings = self._validate_clauses(task_name, clauses, extraction_fields)
+        
+        return list(chain(
+            csv_findings,
+            # Column existence validation
+            self._validate_update_field(task_name, params) if task_name in self._csv_columns else (),
+            clause_findings.columns,
+            # Clause uniqueness validation
+            self._validate_clause_uniqueness(task_name, clauses),
+            # Context path validation
+            clause_findings.context_paths,
+            # Deprecation warnings
+            clause_findings.deprecations,
+            # Semantic validation
+            clause_findings.semantics,
+        ))
     
-    def _validate_csv_structure(self, task_name: str, task_config: Dict[str, Any]) -> List[TaskIssue]:
+    def _validate_csv_structure(self, task_name: str, reference_file: str) -> List[TaskIssue]:
         """Validate CSV file structure and accessibility."""
         findings: List[TaskIssue] = []
-        
-        params = task_config.get("params", {})
-        reference_file = params.get("reference_file")
-        
-        if not reference_file:
-            return findings
-        
-        if not PANDAS_AVAILABLE or pd is None:
-            findings.append(TaskIssue(
-                path=f"tasks.{task_name}.params.reference_file",
-                message="pandas is required for CSV validation but is not available",
-                code="rules-csv-pandas-missing"
-            ))
-            return findings
+        path = f"tasks.{task_name}.params.reference_file"
         
         try:
-            # Try to read the CSV file
-            df = pd.read_csv(reference_file, dtype=str, keep_default_na=False)
+            columns, is_empty = _read_csv_header_cached(reference_file)
             
-            if df.empty:
+            if is_empty:
                 findings.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.reference_file",
+                    path=path,
                     message=f"Reference CSV file '{reference_file}' is empty",
-                    code="rules-csv-empty"
+                    code=_CODE_CSV_EMPTY
                 ))
             
             # Store columns for later validation
-            self._csv_columns[task_name] = df.columns.tolist()
+            self._csv_columns[task_name] = list(columns)
             
         except FileNotFoundError:
             findings.append(TaskIssue(
-                path=f"tasks.{task_name}.params.reference_file",
+                path=path,
                 message=f"Reference CSV file '{reference_file}' not found",
-                code="file-not-found"
+                code=_CODE_FILE_NOT_FOUND
             ))
-        except pd.errors.EmptyDataError:
+        except _CSVHeaderMissingError:
             findings.append(TaskIssue(
-                path=f"tasks.{task_name}.params.reference_file",
+                path=path,
                 message=f"Reference CSV file '{reference_file}' is empty or has no columns",
-                code="rules-csv-missing-headers"
+                code=_CODE_CSV_MISSING_HEADERS
             ))
         except Exception as exc:
             findings.append(TaskIssue(
-                path=f"tasks.{task_name}.params.reference_file",
+                path=path,
                 message=f"Cannot read CSV file '{reference_file}': {exc}",
-                code="rules-csv-not-readable"
+                code=_CODE_CSV_NOT_READABLE
             ))
         
         return findings
     
-    def _validate_column_existence(self, task_name: str, task_config: Dict[str, Any]) -> List[TaskIssue]:
-        """Validate that referenced columns exist in the CSV file."""
-        findings: List[TaskIssue] = []
-        
-        # Skip if CSV validation failed
-        if task_name not in self._csv_columns:
-            return findings
-        
-        params = task_config.get("params", {})
+    def _validate_update_field(self, task_name: str, params: Dict[str, Any]) -> Iterator[TaskIssue]:
+        """Validate that update_field exists in the CSV file."""
         csv_columns = self._csv_columns[task_name]
         
-        # Validate update_field
         update_field = params.get("update_field")
         if update_field and update_field not in csv_columns:
-            findings.append(TaskIssue(
+            yield TaskIssue(
                 path=f"tasks.{task_name}.params.update_field",
                 message=f"Update field '{update_field}' not found in CSV columns: {', '.join(csv_columns)}",
-                code="rules-column-not-found"
-            ))
+                code=_CODE_COLUMN_NOT_FOUND
+            )
+    
+    def _validate_clauses(self, task_name: str, clauses: Tuple[_ClauseView, ...],
+                          extraction_fields: Optional[Dict[str, Any]] = None) -> _ClauseFindings:
+        """Run the per-clause column, context path, deprecation, and semantic checks in one pass."""
+        result = _ClauseFindings()
         
-        # Validate clause columns
-        csv_match = params.get("csv_match", {})
+        if not clauses:
+            return result
         
-        # Validate that csv_match is a dictionary
-        if not isinstance(csv_match, dict):
-            return findings  # Skip validation if csv_match is not a dict (error handled elsewhere)
+        clauses_base = f"tasks.{task_name}.params.csv_match.clauses"
         
-        clauses = csv_match.get("clauses", [])
+        # Column and semantic checks need CSV headers; skip them if CSV validation failed
+        csv_columns = self._csv_columns.get(task_name)
+        if csv_columns is not None:
+            column_set = frozenset(csv_columns)
+            columns_hint = ", ".join(csv_columns)
         
-        for i, clause in enumerate(clauses):
-            if not isinstance(clause, dict):
-                continue
+        # A live keys view gives O(1) lookups without copying the pipeline-wide field map
+        available_fields: AbstractSet[str] = extraction_fields.keys() if extraction_fields else frozenset()
+        
+        # Numeric-name verdicts per column, shared by every clause on that column
+        numeric_by_column: Dict[str, bool] = {}
+        
+        for i, column, from_context, number, _ in clauses:
+            if csv_columns is not None:
+                self._check_clause_column(clauses_base, i, column, column_set, columns_hint, result.columns)
+            
+            if from_context:
+                self._check_clause_context_path(clauses_base, i, from_context, available_fields, result.context_paths)
+                self._check_clause_deprecation(clauses_base, i, from_context, result.deprecations)
                 
-            column = clause.get("column")
-            if column and column not in csv_columns:
+                if csv_columns is not None and column:
+                    self._check_clause_semantics(clauses_base, i, column, from_context, number,
+                                                 numeric_by_column, result.semantics)
+        
+        return result
+    
+    def _check_clause_column(self, clauses_base: str, index: int, column: Any, column_set: AbstractSet[str],
+                             columns_hint: str, findings: List[TaskIssue]) -> None:
+        """Flag a clause column that does not exist in the CSV file."""
+        if column and column not in column_set:
+            findings.append(TaskIssue(
+                path=f"{clauses_base}[{index}].column",
+                message=f"Clause column '{column}' not found in CSV columns: {columns_hint}",
+                code=_CODE_COLUMN_NOT_FOUND
+            ))
+    
+    def _check_clause_context_path(self, clauses_base: str, index: int, from_context: str,
+                                   available_fields: AbstractSet[str], findings: List[TaskIssue]) -> None:
+        """Validate a clause's from_context path syntax and field existence."""
+        issues = self.context_validator.validate_context_path(from_context, available_fields)
+        if not issues:
+            return
+        
+        path = f"{clauses_base}[{index}].from_context"
+        for issue in issues:
+            # Determine severity based on issue type
+            if "Invalid dotted path syntax" in issue:
+                code = _CODE_CONTEXT_PATH_INVALID
+                severity = "error"
+            elif "not found in extraction fields" in issue:
+                code = _CODE_FIELD_NOT_FOUND
+                severity = "warning"
+            else:
+                code = _CODE_CONTEXT_PATH_ISSUE
+                severity = "warning"
+            
+            findings.append(TaskIssue(
+                path=path,
+                message=issue,
+                code=code,
+                details={"severity": severity}
+            ))
+    
+    def _check_clause_deprecation(self, clauses_base: str, index: int, from_context: str,
+                                  findings: List[TaskIssue]) -> None:
+        """Warn about a deprecated 'data.' prefix in a clause's context path."""
+        if from_context.startswith("data."):
+            suggested_path = from_context[5:]  # Remove "data." prefix
+            findings.append(TaskIssue(
+                path=f"{clauses_base}[{index}].from_context",
+                message=f"Deprecated 'data.' prefix in context path: '{from_context}'. "
+                       f"Use bare field name '{suggested_path}' instead.",
+                code=_CODE_DEPRECATED_DATA_PREFIX,
+                details={"severity": "warning", "suggested_replacement": suggested_path}
+            ))
+    
+    def _check_clause_semantics(self, clauses_base: str, index: int, column: str, from_context: str,
+                                number_flag: Any, numeric_by_column: Dict[str, bool],
+                                findings: List[TaskIssue]) -> None:
+        """Flag type mismatches and unrealistic field references in a clause."""
+        # Check for potential type mismatches; only string-forced clauses can mismatch
+        if number_flag is False:
+            is_numeric = numeric_by_column.get(column)
+            if is_numeric is None:
+                is_numeric = numeric_by_column[column] = self._is_likely_numeric_column(column)
+            if is_numeric:
                 findings.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.csv_match.clauses[{i}].column",
-                    message=f"Clause column '{column}' not found in CSV columns: {', '.join(csv_columns)}",
-                    code="rules-column-not-found"
+                    path=f"{clauses_base}[{index}]",
+                    message=f"Column '{column}' appears to be numeric but clause forces string comparison. "
+                           f"Consider removing 'number: false' or verify the column type.",
+                    code=_CODE_SEMANTIC_TYPE_MISMATCH,
+                    details={"severity": "warning"}
                 ))
         
-        return findings
+        # Check for unrealistic field references
+        clean_context = from_context.replace("data.", "") if from_context.startswith("data.") else from_context
+        if self._is_unrealistic_field_reference(clean_context):
+            findings.append(TaskIssue(
+                path=f"{clauses_base}[{index}].from_context",
+                message=f"Field reference '{clean_context}' doesn't match common extraction patterns. "
+                       f"Verify this field exists in your extraction configuration.",
+                code=_CODE_UNREALISTIC_FIELD_REFERENCE,
+                details={"severity": "info"}
+            ))
     
-    def _validate_clause_uniqueness(self, task_name: str, task_config: Dict[str, Any]) -> List[TaskIssue]:
+    def _validate_clause_uniqueness(self, task_name: str, clauses: Tuple[_ClauseView, ...]) -> Iterator[TaskIssue]:
         """Validate clause uniqueness and detect potential conflicts."""
-        findings: List[TaskIssue] = []
-        
-        params = task_config.get("params", {})
-        csv_match = params.get("csv_match", {})
-        
-        # Validate that csv_match is a dictionary
-        if not isinstance(csv_match, dict):
-            return findings  # Skip validation if csv_match is not a dict (error handled elsewhere)
-        
-        clauses = csv_match.get("clauses", [])
+        clauses_base = f"tasks.{task_name}.params.csv_match.clauses"
         
         # Track clauses for duplicate detection
-        clause_signatures = []
+        clause_signatures: Set[Tuple[Any, Any, Any]] = set()
         column_usage = {}
         context_usage = {}
         
-        for i, clause in enumerate(clauses):
-            if not isinstance(clause, dict):
-                continue
-                
-            column = clause.get("column")
-            from_context = clause.get("from_context")
-            
-            # Create signature for exact duplicate detection
-            signature = (column, from_context, clause.get("number", False))
-            
+        for i, column, from_context, _, signature in clauses:
             if signature in clause_signatures:
-                findings.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.csv_match.clauses[{i}]",
+                yield TaskIssue(
+                    path=f"{clauses_base}[{i}]",
                     message=f"Duplicate clause: column='{column}', from_context='{from_context}'",
-                    code="rules-duplicate-clause",
+                    code=_CODE_DUPLICATE_CLAUSE,
                     details={"severity": "error"}
-                ))
+                )
             else:
-                clause_signatures.append(signature)
+                clause_signatures.add(signature)
             
             # Track column usage for impossible condition detection
             if column:
@@ -280,194 +431,110 @@ class RulesTaskValidator:
         # Warn about multiple clauses on same column
         for column, clause_indices in column_usage.items():
             if len(clause_indices) > 1:
-                findings.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.csv_match.clauses",
+                yield TaskIssue(
+                    path=clauses_base,
                     message=f"Multiple clauses reference column '{column}' (indices: {clause_indices}). "
                            f"This may create impossible AND conditions.",
-                    code="rules-impossible-condition",
+                    code=_CODE_IMPOSSIBLE_CONDITION,
                     details={"severity": "warning"}
-                ))
+                )
         
         # Info about multiple clauses using same context
         for context, clause_indices in context_usage.items():
             if len(clause_indices) > 1:
-                findings.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.csv_match.clauses",
+                yield TaskIssue(
+                    path=clauses_base,
                     message=f"Multiple clauses use context '{context}' (indices: {clause_indices}). "
                            f"This might be intentional but worth noting.",
-                    code="rules-context-reuse",
+                    code=_CODE_CONTEXT_REUSE,
                     details={"severity": "info"}
-                ))
-        
-        return findings
-    
-    def _validate_context_paths(self, task_name: str, task_config: Dict[str, Any], 
-                               extraction_fields: Optional[Dict[str, Any]] = None) -> List[TaskIssue]:
-        """Validate context paths in clauses."""
-        findings: List[TaskIssue] = []
-        
-        params = task_config.get("params", {})
-        csv_match = params.get("csv_match", {})
-        
-        # Validate that csv_match is a dictionary
-        if not isinstance(csv_match, dict):
-            return findings  # Skip validation if csv_match is not a dict (error handled elsewhere)
-        
-        clauses = csv_match.get("clauses", [])
-        
-        # Extract available field names from extraction fields
-        available_fields = []
-        if extraction_fields:
-            available_fields = list(extraction_fields.keys())
-        
-        for i, clause in enumerate(clauses):
-            if not isinstance(clause, dict):
-                continue
-                
-            from_context = clause.get("from_context")
-            if not from_context:
-                continue
-            
-            issues = self.context_validator.validate_context_path(from_context, available_fields)
-            
-            for issue in issues:
-                # Determine severity based on issue type
-                if "Invalid dotted path syntax" in issue:
-                    code = "rules-context-path-invalid"
-                    severity = "error"
-                elif "not found in extraction fields" in issue:
-                    code = "rules-field-not-found"
-                    severity = "warning"
-                else:
-                    code = "rules-context-path-issue"
-                    severity = "warning"
-                
-                findings.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.csv_match.clauses[{i}].from_context",
-                    message=issue,
-                    code=code,
-                    details={"severity": severity}
-                ))
-        
-        return findings
-    
-    def _check_deprecation_warnings(self, task_name: str, task_config: Dict[str, Any]) -> List[TaskIssue]:
-        """Check for deprecated 'data.' prefixes in context paths."""
-        findings: List[TaskIssue] = []
-        
-        params = task_config.get("params", {})
-        csv_match = params.get("csv_match", {})
-        
-        # Validate that csv_match is a dictionary
-        if not isinstance(csv_match, dict):
-            return findings  # Skip validation if csv_match is not a dict (error handled elsewhere)
-        
-        clauses = csv_match.get("clauses", [])
-        
-        for i, clause in enumerate(clauses):
-            if not isinstance(clause, dict):
-                continue
-                
-            from_context = clause.get("from_context", "")
-            if from_context and from_context.startswith("data."):
-                suggested_path = from_context[5:]  # Remove "data." prefix
-                findings.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.csv_match.clauses[{i}].from_context",
-                    message=f"Deprecated 'data.' prefix in context path: '{from_context}'. "
-                           f"Use bare field name '{suggested_path}' instead.",
-                    code="rules-deprecated-data-prefix",
-                    details={"severity": "warning", "suggested_replacement": suggested_path}
-                ))
-        
-        return findings
-    
-    def _validate_semantic_issues(self, task_name: str, task_config: Dict[str, Any], 
-                                 extraction_fields: Optional[Dict[str, Any]] = None) -> List[TaskIssue]:
-        """Validate semantic issues like type mismatches and unrealistic field references."""
-        findings: List[TaskIssue] = []
-        
-        params = task_config.get("params", {})
-        csv_match = params.get("csv_match", {})
-        
-        # Validate that csv_match is a dictionary
-        if not isinstance(csv_match, dict):
-            return findings  # Skip validation if csv_match is not a dict (error handled elsewhere)
-        
-        clauses = csv_match.get("clauses", [])
-        
-        # Skip if CSV validation failed
-        if task_name not in self._csv_columns:
-            return findings
-        
-        csv_columns = self._csv_columns[task_name]
-        
-        for i, clause in enumerate(clauses):
-            if not isinstance(clause, dict):
-                continue
-                
-            column = clause.get("column")
-            from_context = clause.get("from_context", "")
-            number_flag = clause.get("number")
-            
-            if not column or not from_context:
-                continue
-            
-            # Check for potential type mismatches
-            if self._is_likely_numeric_column(column) and number_flag is False:
-                findings.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.csv_match.clauses[{i}]",
-                    message=f"Column '{column}' appears to be numeric but clause forces string comparison. "
-                           f"Consider removing 'number: false' or verify the column type.",
-                    code="rules-semantic-type-mismatch",
-                    details={"severity": "warning"}
-                ))
-            
-            # Check for unrealistic field references
-            clean_context = from_context.replace("data.", "") if from_context.startswith("data.") else from_context
-            if self._is_unrealistic_field_reference(clean_context):
-                findings.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.csv_match.clauses[{i}].from_context",
-                    message=f"Field reference '{clean_context}' doesn't match common extraction patterns. "
-                           f"Verify this field exists in your extraction configuration.",
-                    code="rules-unrealistic-field-reference",
-                    details={"severity": "info"}
-                ))
-        
-        return findings
+                )
     
     def _is_likely_numeric_column(self, column_name: str) -> bool:
         """Check if a column name suggests numeric content."""
-        numeric_indicators = [
-            'amount', 'total', 'price', 'cost', 'value', 'sum', 'count', 'number',
-            'qty', 'quantity', 'rate', 'percent', 'percentage', 'tax', 'fee',
-            'balance', 'credit', 'debit', 'invoice_total', 'subtotal'
-        ]
-        
-        column_lower = column_name.lower()
-        return any(indicator in column_lower for indicator in numeric_indicators)
+        return _is_numeric_column_name(column_name)
     
     def _is_unrealistic_field_reference(self, field_name: str) -> bool:
         """Check if a field reference seems unrealistic for typical extraction."""
-        # Common extraction field patterns
-        common_patterns = [
-            'invoice', 'date', 'amount', 'total', 'supplier', 'vendor', 'customer',
-            'address', 'phone', 'email', 'number', 'id', 'reference', 'order',
-            'purchase', 'tax', 'description', 'item', 'quantity', 'price', 'cost'
-        ]
-        
-        field_lower = field_name.lower()
-        
-        # If field contains common patterns, it's likely realistic
-        if any(pattern in field_lower for pattern in common_patterns):
-            return False
-        
-        # Check for very generic or system-like names that might be unrealistic
-        unrealistic_patterns = [
-            'test', 'example', 'sample', 'dummy', 'temp', 'tmp', 'debug',
-            'foo', 'bar', 'baz', 'placeholder', 'xxx', 'yyy', 'zzz'
-        ]
-        
-        return any(pattern in field_lower for pattern in unrealistic_patterns)
+        return _is_unrealistic_field_name(field_name)
+
+
+@lru_cache(maxsize=1024)
+def _is_numeric_column_name(column_name: str) -> bool:
+    column_lower = column_name.lower()
+    if column_lower in _NUMERIC_INDICATORS:
+        return True
+    return any(indicator in column_lower for indicator in _NUMERIC_INDICATORS)
+
+
+@lru_cache(maxsize=1024)
+def _is_unrealistic_field_name(field_name: str) -> bool:
+    field_lower = field_name.lower()
+    
+    # Most references name a common field outright; a hash probe on the leaf
+    # settles those without scanning every pattern
+    if field_lower.rpartition(".")[2] in _COMMON_FIELD_PATTERNS:
+        return False
+    
+    # If field contains common patterns, it's likely realistic
+    if any(pattern in field_lower for pattern in _COMMON_FIELD_PATTERNS):
+        return False
+    
+    # Check for very generic or system-like names that might be unrealistic
+    return any(pattern in field_lower for pattern in _UNREALISTIC_FIELD_PATTERNS)
+
+
+@lru_cache(maxsize=None)
+def _load_pandas() -> Any:
+    """Import pandas on first use, returning None when it is not installed."""
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    return pd
+
+
+def _read_csv_header_cached(reference_file: str) -> Tuple[List[str], bool]:
+    """Return ``(columns, is_empty)`` for a CSV, reusing results for unchanged files."""
+    stat_result = os.stat(reference_file)
+    key = (os.path.abspath(reference_file), stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _CSV_HEADER_CACHE.get(key)
+    if cached is None:
+        cached = _read_csv_header(reference_file)
+        # The web process validates for its whole lifetime; edited files leave
+        # old keys behind, so start over rather than grow without bound
+        if len(_CSV_HEADER_CACHE) >= _CSV_HEADER_CACHE_LIMIT:
+            _CSV_HEADER_CACHE.clear()
+        _CSV_HEADER_CACHE[key] = cached
+    return cached
+
+
+def _read_csv_header(reference_file: str) -> Tuple[List[str], bool]:
+    """Read the header row and probe for one data row.
+
+    Blank lines are skipped, matching pandas' default. Files the stdlib
+    reader rejects are retried with pandas when it is installed.
+
+    Raises:
+        _CSVHeaderMissingError: If the file has no header row.
+    """
+    try:
+        with open(reference_file, "r", encoding="utf-8-sig", newline="") as handle:
+            rows = (row for row in csv.reader(handle) if row)
+            header = next(rows, None)
+            if header is None:
+                raise _CSVHeaderMissingError(reference_file)
+            return header, next(rows, None) is None
+    except csv.Error:
+        pd = _load_pandas()
+        if pd is None:
+            raise
+        try:
+            # One data row is enough to tell whether the file is empty
+            df = pd.read_csv(reference_file, dtype=str, keep_default_na=False, nrows=1)
+        except pd.errors.EmptyDataError as exc:
+            raise _CSVHeaderMissingError(reference_file) from exc
+        return df.columns.tolist(), df.empty
 
 
 def validate_rules_task(task_name: str, task_config: Dict[str, Any], 
@@ -482,5 +549,22 @@ def validate_rules_task(task_name: str, task_config: Dict[str, Any],
     Returns:
         List of TaskIssue objects representing validation findings
     """
-    validator = RulesTaskValidator()
-    return validator.validate_rules_task(task_name, task_config, extraction_fields)
+    return _shared_validator().validate_rules_task(task_name, task_config, extraction_fields)
+
+
+_THREAD_STATE = threading.local()
+
+
+def _shared_validator() -> RulesTaskValidator:
+    """Return this thread's reusable validator instance."""
+    validator = getattr(_THREAD_STATE, "validator", None)
+    if validator is None:
+        validator = RulesTaskValidator()
+        _THREAD_STATE.validator = validator
+    return validator
+
+
+def reset_cache() -> None:
+    """Drop cached CSV headers and the current thread's shared validator."""
+    _CSV_HEADER_CACHE.clear()
+    _THREAD_STATE.validator = None
@@ -14,7 +14,11 @@ Key Features:
 - Optional file system validation mode activated by --check-files flag
 - File existence and accessibility validation
 - Directory permission and accessibility checking
-- CSV file structure validation with pandas integration
+- CSV file structure validation reading only each file's header and first row,
+  using pyarrow when installed and pandas otherwise
+- Concurrent reads of distinct reference CSVs, with parsed headers cached
+  between runs by path, modification time and size in the per-user cache
+  directory (turned off with --no-cache or CONFIG_CHECK_NO_CACHE=1)
 - Detailed error reporting for file system issues
 - Windows-compatible file path handling
 
@@ -40,20 +44,81 @@ Note:
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
+import json
 import os
+import stat
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    pd = None  # type: ignore[assignment]
-    PANDAS_AVAILABLE = False
+# pandas is only needed for --check-files CSV validation; probe for it here
+# and import it on first use
+PANDAS_AVAILABLE = importlib.util.find_spec("pandas") is not None
 
+# pyarrow is optional; when installed its streaming CSV reader is used to read
+# reference CSV headers instead of pandas
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+from .pipeline_validator import MODULE_PREFIX_CLASSIFICATION
+from .path_validator import is_missing_path_error
 from .task_validator import TaskIssue
 
+# Module prefixes of rules tasks, the only tasks with reference CSVs
+_RULES_MODULE_PREFIXES = tuple(
+    prefix for prefix, classification in MODULE_PREFIX_CLASSIFICATION.items() if classification == "rules"
+)
+
+# Upper bound on concurrent reference CSV reads
+_CSV_READ_WORKERS = 8
+
+# Setting this environment variable to anything but 0/false/no turns off the
+# CSV schema cache, like the --no-cache flag
+_CACHE_DISABLE_ENV_VAR = "CONFIG_CHECK_NO_CACHE"
+
+# Schema cache entries kept on disk before the cache is emptied
+_CSV_SCHEMA_CACHE_LIMIT = 256
+
+
+def _default_csv_schema_cache_dir() -> Optional[Path]:
+    """Return the per-user cache directory for parsed CSV schemas, if there is one."""
+    if os.name == "nt":
+        local_app_data = os.environ.get("LOCALAPPDATA")
+        if not local_app_data:
+            return None
+        cache_home = Path(local_app_data)
+    else:
+        xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+        try:
+            if xdg_cache_home:
+                cache_home = Path(xdg_cache_home)
+            elif sys.platform == "darwin":
+                cache_home = Path("~/Library/Caches").expanduser()
+            else:
+                cache_home = Path("~/.cache").expanduser()
+        except RuntimeError:
+            return None
+    return cache_home / "pdfdoc_extraction" / "config_check"
+
+
+# Directory holding parsed reference CSV schemas between runs; None disables it
+_CSV_SCHEMA_CACHE_DIR: Optional[Path] = _default_csv_schema_cache_dir()
+
+
+def _cache_disabled_by_env() -> bool:
+    """Return whether the environment turns off the CSV schema cache."""
+    return os.environ.get(_CACHE_DISABLE_ENV_VAR, "").strip().lower() not in ("", "0", "false", "no")
+
+
+# Task parameters that name directories the task reads from or writes to
+_TASK_DIR_PARAMS = ("data_dir", "files_dir", "archive_dir", "processing_dir")
+
 
 @dataclass
 class FileValidationResult:
@@ -65,274 +130,360 @@ class FileValidationResult:
 class RuntimeFileValidator:
     """Validator for runtime file dependencies."""
     
-    def __init__(self, base_dir: Optional[Path] = None):
+    def __init__(self, base_dir: Optional[Path] = None, use_cache: bool = True):
         self.base_dir = base_dir or Path.cwd()
+        self._resolved_paths: Dict[str, Path] = {}
+        self._stat_cache: Dict[Path, Optional[os.stat_result]] = {}
+        self._schema_cache_dir = (
+            _CSV_SCHEMA_CACHE_DIR if use_cache and not _cache_disabled_by_env() else None
+        )
     
     def validate_file_dependencies(self, config: Dict[str, Any]) -> FileValidationResult:
         """Validate file paths and CSV structures at runtime."""
-        errors: List[TaskIssue] = []
-        warnings: List[TaskIssue] = []
-        
-        # Validate reference files for rules tasks
-        rules_errors, rules_warnings = self._validate_reference_files(config)
-        errors.extend(rules_errors)
-        warnings.extend(rules_warnings)
-        
-        # Validate directory permissions
-        dir_errors, dir_warnings = self._validate_directory_permissions(config)
-        errors.extend(dir_errors)
-        warnings.extend(dir_warnings)
+        rules_tasks, dir_targets = self._collect_targets(config)
         
-        # Validate CSV file structures
-        csv_errors, csv_warnings = self._validate_csv_files(config)
-        errors.extend(csv_errors)
-        warnings.extend(csv_warnings)
+        reference_errors = self._check_reference_files(rules_tasks)
+        dir_errors = self._check_directories(dir_targets)
+        csv_errors, csv_warnings = self._check_csv_structures(rules_tasks)
         
-        return FileValidationResult(errors=errors, warnings=warnings)
+        errors = list(chain(reference_errors, dir_errors, csv_errors))
+        return FileValidationResult(errors=errors, warnings=csv_warnings)
     
     def _validate_reference_files(self, config: Dict[str, Any]) -> tuple[List[TaskIssue], List[TaskIssue]]:
         """Validate reference files for rules tasks."""
-        errors: List[TaskIssue] = []
-        warnings: List[TaskIssue] = []
+        rules_tasks, _ = self._collect_targets(config)
+        return self._check_reference_files(rules_tasks), []
+    
+    def _validate_directory_permissions(self, config: Dict[str, Any]) -> tuple[List[TaskIssue], List[TaskIssue]]:
+        """Validate directory permissions for configured paths."""
+        _, dir_targets = self._collect_targets(config)
+        return self._check_directories(dir_targets), []
+    
+    def _validate_csv_files(self, config: Dict[str, Any]) -> tuple[List[TaskIssue], List[TaskIssue]]:
+        """Validate CSV file structures."""
+        rules_tasks, _ = self._collect_targets(config)
+        return self._check_csv_structures(rules_tasks)
+    
+    def _collect_targets(
+        self, config: Dict[str, Any]
+    ) -> Tuple[List[Tuple[Any, Dict[str, Any]]], List[Tuple[Path, str, str]]]:
+        """Walk the tasks once, returning ``(rules_tasks, dir_targets)`` with their stats prefetched."""
+        # Each run sees the file system as it is now
+        self._resolved_paths.clear()
+        self._stat_cache.clear()
         
+        # Top-level directories are reported ahead of task directories
+        dir_targets = self._global_directory_targets(config)
+        rules_tasks: List[Tuple[Any, Dict[str, Any]]] = []
+        
+        # First collect every path the config references
+        for task_name, params, is_rules_task in self._iter_task_params(config):
+            if is_rules_task:
+                rules_tasks.append((task_name, params))
+            dir_targets.extend(self._task_directory_targets(task_name, params))
+        
+        # then list each shared parent directory once before checking any of them
+        reference_paths = [
+            self._resolve_path(params["reference_file"])
+            for _, params in rules_tasks if params.get("reference_file")
+        ]
+        self._prefetch_stats(chain(reference_paths, (dir_path for dir_path, _, _ in dir_targets)))
+        return rules_tasks, dir_targets
+    
+    @staticmethod
+    def _iter_task_params(config: Dict[str, Any]) -> Iterator[Tuple[Any, Dict[str, Any], bool]]:
+        """Yield ``(task_name, params, is_rules_task)`` for tasks with dict params."""
         tasks = config.get("tasks", {})
         if not isinstance(tasks, dict):
-            return errors, warnings
+            return
         
         for task_name, task_config in tasks.items():
             if not isinstance(task_config, dict):
                 continue
             
-            # Check if this is a rules task
-            module_name = task_config.get("module", "")
-            if not isinstance(module_name, str) or "rules" not in module_name:
-                continue
-            
             params = task_config.get("params", {})
             if not isinstance(params, dict):
                 continue
             
-            reference_file = params.get("reference_file")
-            if not reference_file:
-                continue
-            
-            # Validate file existence and accessibility
-            file_path = self._resolve_path(reference_file)
-            
-            if not file_path.exists():
-                errors.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.reference_file",
-                    message=f"Reference file does not exist: {file_path}",
-                    code="file-not-found",
-                    details={"file_path": str(file_path)}
-                ))
-                continue
-            
-            if not file_path.is_file():
-                errors.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.reference_file",
-                    message=f"Reference path is not a file: {file_path}",
-                    code="file-not-file",
-                    details={"file_path": str(file_path)}
-                ))
-                continue
-            
-            # Check file readability
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    f.read(1)  # Try to read one character
-            except PermissionError:
-                errors.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.reference_file",
-                    message=f"Reference file is not readable (permission denied): {file_path}",
-                    code="file-not-readable",
-                    details={"file_path": str(file_path)}
-                ))
-            except Exception as exc:
-                errors.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.reference_file",
-                    message=f"Cannot access reference file: {file_path}. Error: {exc}",
-                    code="file-access-error",
-                    details={"file_path": str(file_path), "error": str(exc)}
-                ))
-        
-        return errors, warnings
+            # Check if this is a rules task
+            module_name = task_config.get("module", "")
+            is_rules_task = isinstance(module_name, str) and module_name.startswith(_RULES_MODULE_PREFIXES)
+            yield task_name, params, is_rules_task
     
-    def _validate_directory_permissions(self, config: Dict[str, Any]) -> tuple[List[TaskIssue], List[TaskIssue]]:
-        """Validate directory permissions for configured paths."""
+    def _check_reference_files(self, rules_tasks: List[Tuple[Any, Dict[str, Any]]]) -> List[TaskIssue]:
+        """Check the reference file of each collected rules task."""
         errors: List[TaskIssue] = []
-        warnings: List[TaskIssue] = []
+        for task_name, params in rules_tasks:
+            self._check_reference_file(task_name, params, errors)
+        return errors
+    
+    def _check_reference_file(self, task_name: str, params: Dict[str, Any], errors: List[TaskIssue]) -> None:
+        """Check that a rules task's reference file exists and is readable."""
+        reference_file = params.get("reference_file")
+        if not reference_file:
+            return
+        
+        # Validate file existence and accessibility
+        file_path = self._resolve_path(reference_file)
+        file_path_str = str(file_path)
+        
+        file_stat = self._cached_stat(file_path)
+        
+        if file_stat is None:
+            errors.append(TaskIssue(
+                path=f"tasks.{task_name}.params.reference_file",
+                message=f"Reference file does not exist: {file_path}",
+                code="file-not-found",
+                details={"file_path": file_path_str}
+            ))
+            return
+        
+        if not stat.S_ISREG(file_stat.st_mode):
+            errors.append(TaskIssue(
+                path=f"tasks.{task_name}.params.reference_file",
+                message=f"Reference path is not a file: {file_path}",
+                code="file-not-file",
+                details={"file_path": file_path_str}
+            ))
+            return
+        
+        # Check file readability; the file is known to exist, so a failed
+        # access check means permission was denied
+        try:
+            readable = os.access(file_path, os.R_OK)
+        except OSError as exc:
+            errors.append(TaskIssue(
+                path=f"tasks.{task_name}.params.reference_file",
+                message=f"Cannot access reference file: {file_path}. Error: {exc}",
+                code="file-access-error",
+                details={"file_path": file_path_str, "error": str(exc)}
+            ))
+            return
+        
+        if not readable:
+            errors.append(TaskIssue(
+                path=f"tasks.{task_name}.params.reference_file",
+                message=f"Reference file is not readable (permission denied): {file_path}",
+                code="file-not-readable",
+                details={"file_path": file_path_str}
+            ))
+    
+    def _global_directory_targets(self, config: Dict[str, Any]) -> List[Tuple[Path, str, str]]:
+        """Collect the web upload and watch folder directories to check."""
+        targets: List[Tuple[Path, str, str]] = []
         
         # Check web upload directory
         web_config = config.get("web", {})
         if isinstance(web_config, dict):
             upload_dir = web_config.get("upload_dir")
             if upload_dir:
-                dir_path = self._resolve_path(upload_dir)
-                dir_errors = self._validate_directory_access(
-                    dir_path, "web.upload_dir", "Web upload directory"
-                )
-                errors.extend(dir_errors)
+                targets.append((self._resolve_path(upload_dir), "web.upload_dir", "Web upload directory"))
         
         # Check watch folder directories
         watch_folder_config = config.get("watch_folder", {})
         if isinstance(watch_folder_config, dict):
             watch_dir = watch_folder_config.get("dir")
             if watch_dir:
-                dir_path = self._resolve_path(watch_dir)
-                dir_errors = self._validate_directory_access(
-                    dir_path, "watch_folder.dir", "Watch folder directory"
-                )
-                errors.extend(dir_errors)
+                targets.append((self._resolve_path(watch_dir), "watch_folder.dir", "Watch folder directory"))
             
             processing_dir = watch_folder_config.get("processing_dir")
             if processing_dir:
-                dir_path = self._resolve_path(processing_dir)
-                dir_errors = self._validate_directory_access(
-                    dir_path, "watch_folder.processing_dir", "Processing directory"
-                )
-                errors.extend(dir_errors)
+                targets.append((
+                    self._resolve_path(processing_dir), "watch_folder.processing_dir", "Processing directory"
+                ))
         
-        # Check task-specific directories
-        tasks = config.get("tasks", {})
-        if isinstance(tasks, dict):
-            for task_name, task_config in tasks.items():
-                if not isinstance(task_config, dict):
-                    continue
-                
-                params = task_config.get("params", {})
-                if not isinstance(params, dict):
-                    continue
-                
-                # Check various directory parameters
-                dir_params = ["data_dir", "files_dir", "archive_dir", "processing_dir"]
-                for param_name in dir_params:
-                    param_value = params.get(param_name)
-                    if param_value:
-                        dir_path = self._resolve_path(param_value)
-                        dir_errors = self._validate_directory_access(
-                            dir_path, 
-                            f"tasks.{task_name}.params.{param_name}",
-                            f"Task {task_name} {param_name}"
-                        )
-                        errors.extend(dir_errors)
+        return targets
+    
+    def _task_directory_targets(self, task_name: str, params: Dict[str, Any]) -> List[Tuple[Path, str, str]]:
+        """Collect the directory parameters of a single task to check."""
+        targets: List[Tuple[Path, str, str]] = []
+        for param_name in _TASK_DIR_PARAMS:
+            param_value = params.get(param_name)
+            if param_value:
+                targets.append((
+                    self._resolve_path(param_value),
+                    f"tasks.{task_name}.params.{param_name}",
+                    f"Task {task_name} {param_name}",
+                ))
+        return targets
+    
+    def _check_directories(self, targets: List[Tuple[Path, str, str]]) -> List[TaskIssue]:
+        """Validate collected directories against the prefetched stat cache."""
+        errors: List[TaskIssue] = []
+        for dir_path, config_path, description in targets:
+            errors.extend(self._validate_directory_access(dir_path, config_path, description))
+        return errors
+    
+    def _check_csv_structures(
+        self, rules_tasks: List[Tuple[Any, Dict[str, Any]]]
+    ) -> tuple[List[TaskIssue], List[TaskIssue]]:
+        """Check the reference CSV of each collected rules task."""
+        errors: List[TaskIssue] = []
+        warnings = self._csv_validation_warnings()
+        if warnings:
+            return errors, warnings
+        
+        jobs: List[Tuple[Any, Dict[str, Any], Path]] = []
+        for task_name, params in rules_tasks:
+            file_path = self._csv_target(params)
+            if file_path is not None:
+                jobs.append((task_name, params, file_path))
         
+        self._check_csv_files(jobs, errors, warnings)
         return errors, warnings
     
-    def _validate_csv_files(self, config: Dict[str, Any]) -> tuple[List[TaskIssue], List[TaskIssue]]:
-        """Validate CSV file structures."""
-        errors: List[TaskIssue] = []
-        warnings: List[TaskIssue] = []
+    @staticmethod
+    def _csv_validation_warnings() -> List[TaskIssue]:
+        """Return the warning raised when CSV structure validation cannot run."""
+        if not (PYARROW_AVAILABLE or PANDAS_AVAILABLE):
+            return [_pandas_unavailable_issue()]
+        return []
+    
+    def _csv_target(self, params: Dict[str, Any]) -> Optional[Path]:
+        """Return the reference CSV a rules task needs checked, if it exists."""
+        reference_file = params.get("reference_file")
+        if not reference_file:
+            return None
         
-        if not PANDAS_AVAILABLE or pd is None:
-            warnings.append(TaskIssue(
-                path="runtime_validation",
-                message="pandas is not available for CSV structure validation",
-                code="csv-validation-unavailable"
-            ))
-            return errors, warnings
+        file_path = self._resolve_path(reference_file)
         
-        tasks = config.get("tasks", {})
-        if not isinstance(tasks, dict):
-            return errors, warnings
+        # Skip missing paths and non-files (already reported in file validation)
+        file_stat = self._cached_stat(file_path)
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+            return None
+        return file_path
+    
+    def _check_csv_files(self, jobs: List[Tuple[Any, Dict[str, Any], Path]],
+                         errors: List[TaskIssue], warnings: List[TaskIssue]) -> None:
+        """Read each distinct reference CSV once, overlapping reads, and check every task."""
+        if not jobs:
+            return
         
-        for task_name, task_config in tasks.items():
-            if not isinstance(task_config, dict):
+        heads: Dict[Path, Tuple[List[str], bool, Optional[Exception]]] = {}
+        cache_keys: Dict[Path, Optional[str]] = {}
+        cache_dir = self._schema_cache_dir
+        for file_path in dict.fromkeys(file_path for _, _, file_path in jobs):
+            file_stat = self._cached_stat(file_path)
+            # A zero-byte file has no header row, whichever backend would read it
+            if file_stat is not None and file_stat.st_size == 0:
+                heads[file_path] = ([], False, _EmptyCSVError(f"CSV file is empty: {file_path}"))
                 continue
+            cache_key = _csv_schema_cache_key(cache_dir, file_path, file_stat)
+            cached = _load_csv_schema(cache_dir, cache_key)
+            if cached is not None:
+                heads[file_path] = cached
+            else:
+                cache_keys[file_path] = cache_key
+        
+        paths = list(cache_keys)
+        if paths:
+            # An installed but broken CSV backend only shows up on import
+            if _csv_backend() is None:
+                warnings.append(_pandas_unavailable_issue())
+                return
             
-            # Check if this is a rules task
-            module_name = task_config.get("module", "")
-            if not isinstance(module_name, str) or "rules" not in module_name:
-                continue
+            if len(paths) > 1:
+                with ThreadPoolExecutor(max_workers=min(_CSV_READ_WORKERS, len(paths))) as executor:
+                    heads.update(zip(paths, executor.map(_read_csv_head, paths)))
+            else:
+                heads[paths[0]] = _read_csv_head(paths[0])
             
-            params = task_config.get("params", {})
-            if not isinstance(params, dict):
-                continue
+            if cache_dir is not None:
+                _prune_csv_schema_cache(cache_dir)
+                for file_path in paths:
+                    _store_csv_schema(cache_dir, cache_keys[file_path], heads[file_path])
+        
+        for task_name, params, file_path in jobs:
+            self._check_csv_head(task_name, params, file_path, heads[file_path], errors, warnings)
+    
+    def _check_csv_head(self, task_name: str, params: Dict[str, Any], file_path: Path,
+                        head: Tuple[List[str], bool, Optional[Exception]],
+                        errors: List[TaskIssue], warnings: List[TaskIssue]) -> None:
+        """Check a rules task's reference CSV for emptiness and missing columns."""
+        columns, is_empty, read_error = head
+        params_prefix = f"tasks.{task_name}.params"
+        file_path_str = str(file_path)
+        try:
+            if read_error is not None:
+                raise read_error
             
-            reference_file = params.get("reference_file")
-            if not reference_file:
-                continue
+            if is_empty:
+                warnings.append(TaskIssue(
+                    path=f"{params_prefix}.reference_file",
+                    message=f"CSV file is empty: {file_path}",
+                    code="csv-empty",
+                    details={"file_path": file_path_str}
+                ))
             
-            file_path = self._resolve_path(reference_file)
+            column_set = set(columns)
+            columns_hint: Optional[str] = None
             
-            # Skip if file doesn't exist (already reported in file validation)
-            if not file_path.exists():
-                continue
+            # Check for required columns based on task configuration
+            update_field = params.get("update_field")
+            if update_field and update_field not in column_set:
+                columns_hint = ", ".join(columns)
+                errors.append(TaskIssue(
+                    path=f"{params_prefix}.update_field",
+                    message=f"Update field '{update_field}' not found in CSV columns: {columns_hint}",
+                    code="csv-missing-column",
+                    details={"file_path": file_path_str, "missing_column": update_field}
+                ))
             
-            # Validate CSV structure
-            try:
-                df = pd.read_csv(file_path, dtype=str, keep_default_na=False)
-                
-                if df.empty:
-                    warnings.append(TaskIssue(
-                        path=f"tasks.{task_name}.params.reference_file",
-                        message=f"CSV file is empty: {file_path}",
-                        code="csv-empty",
-                        details={"file_path": str(file_path)}
-                    ))
+            # Check clause columns
+            csv_match = params.get("csv_match", {})
+            clauses = csv_match.get("clauses", [])
+            for i, clause in enumerate(clauses):
+                if not isinstance(clause, dict):
+                    continue
                 
-                # Check for required columns based on task configuration
-                update_field = params.get("update_field")
-                if update_field and update_field not in df.columns:
+                column = clause.get("column")
+                if column and column not in column_set:
+                    if columns_hint is None:
+                        columns_hint = ", ".join(columns)
                     errors.append(TaskIssue(
-                        path=f"tasks.{task_name}.params.update_field",
-                        message=f"Update field '{update_field}' not found in CSV columns: {', '.join(df.columns)}",
+                        path=f"{params_prefix}.csv_match.clauses[{i}].column",
+                        message=f"Clause column '{column}' not found in CSV columns: {columns_hint}",
                         code="csv-missing-column",
-                        details={"file_path": str(file_path), "missing_column": update_field}
+                        details={"file_path": file_path_str, "missing_column": column}
                     ))
-                
-                # Check clause columns
-                csv_match = params.get("csv_match", {})
-                clauses = csv_match.get("clauses", [])
-                for i, clause in enumerate(clauses):
-                    if not isinstance(clause, dict):
-                        continue
-                    
-                    column = clause.get("column")
-                    if column and column not in df.columns:
-                        errors.append(TaskIssue(
-                            path=f"tasks.{task_name}.params.csv_match.clauses[{i}].column",
-                            message=f"Clause column '{column}' not found in CSV columns: {', '.join(df.columns)}",
-                            code="csv-missing-column",
-                            details={"file_path": str(file_path), "missing_column": column}
-                        ))
-                
-            except pd.errors.EmptyDataError:
-                errors.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.reference_file",
-                    message=f"CSV file has no data or invalid format: {file_path}",
-                    code="csv-invalid-format",
-                    details={"file_path": str(file_path)}
-                ))
-            except Exception as exc:
-                errors.append(TaskIssue(
-                    path=f"tasks.{task_name}.params.reference_file",
-                    message=f"Cannot parse CSV file: {file_path}. Error: {exc}",
-                    code="csv-parse-error",
-                    details={"file_path": str(file_path), "error": str(exc)}
-                ))
-        
-        return errors, warnings
+            
+        except _EmptyCSVError:
+            errors.append(TaskIssue(
+                path=f"{params_prefix}.reference_file",
+                message=f"CSV file has no data or invalid format: {file_path}",
+                code="csv-invalid-format",
+                details={"file_path": file_path_str}
+            ))
+        except Exception as exc:
+            errors.append(TaskIssue(
+                path=f"{params_prefix}.reference_file",
+                message=f"Cannot parse CSV file: {file_path}. Error: {exc}",
+                code="csv-parse-error",
+                details={"file_path": file_path_str, "error": str(exc)}
+            ))
     
     def _validate_directory_access(self, dir_path: Path, config_path: str, description: str) -> List[TaskIssue]:
-        """Validate directory access and permissions."""
+        """Validate directory access and permissions.
+        
+        The issue path and message already name the directory, so these
+        issues carry no details mapping.
+        """
         errors: List[TaskIssue] = []
+        dir_stat = self._cached_stat(dir_path)
         
-        if not dir_path.exists():
+        if dir_stat is None:
             errors.append(TaskIssue(
                 path=config_path,
                 message=f"{description} does not exist: {dir_path}",
-                code="directory-not-found",
-                details={"directory_path": str(dir_path)}
+                code="directory-not-found"
             ))
             return errors
         
-        if not dir_path.is_dir():
+        if not stat.S_ISDIR(dir_stat.st_mode):
             errors.append(TaskIssue(
                 path=config_path,
                 message=f"{description} is not a directory: {dir_path}",
-                code="path-not-directory",
-                details={"directory_path": str(dir_path)}
+                code="path-not-directory"
             ))
             return errors
         
@@ -341,8 +492,7 @@ class RuntimeFileValidator:
             errors.append(TaskIssue(
                 path=config_path,
                 message=f"{description} is not readable: {dir_path}",
-                code="directory-not-readable",
-                details={"directory_path": str(dir_path)}
+                code="directory-not-readable"
             ))
         
         # Check write access
@@ -350,29 +500,248 @@ class RuntimeFileValidator:
             errors.append(TaskIssue(
                 path=config_path,
                 message=f"{description} is not writable: {dir_path}",
-                code="directory-not-writable",
-                details={"directory_path": str(dir_path)}
+                code="directory-not-writable"
             ))
         
         return errors
     
     def _resolve_path(self, path_str: str) -> Path:
         """Resolve a path string relative to the base directory."""
-        path = Path(path_str)
-        if path.is_absolute():
-            return path
-        return self.base_dir / path
+        resolved = self._resolved_paths.get(path_str)
+        if resolved is None:
+            path = Path(path_str)
+            resolved = path if path.is_absolute() else self.base_dir / path
+            self._resolved_paths[path_str] = resolved
+        return resolved
+    
+    def _prefetch_stats(self, paths: Iterable[Path]) -> None:
+        """Seed the stat cache with one directory listing per parent shared by several paths.
+        
+        Only paths found in a listing are cached; anything else, including
+        names that differ only in case on case-insensitive file systems, is
+        left to ``_cached_stat``.
+        """
+        by_parent: Dict[Path, Dict[str, Path]] = {}
+        for path in paths:
+            if path in self._stat_cache or path.name in ("", ".", ".."):
+                continue
+            by_parent.setdefault(path.parent, {})[path.name] = path
+        
+        for parent, wanted in by_parent.items():
+            # A single stat is cheaper than listing the parent
+            if len(wanted) < 2:
+                continue
+            try:
+                with os.scandir(parent) as entries:
+                    for entry in entries:
+                        path = wanted.pop(entry.name, None)
+                        if path is None:
+                            continue
+                        try:
+                            self._stat_cache[path] = entry.stat()
+                        except OSError:
+                            pass
+                        if not wanted:
+                            break
+            except OSError:
+                continue
+    
+    def _cached_stat(self, path: Path) -> Optional[os.stat_result]:
+        """Stat a path once per run, returning None when it does not exist."""
+        try:
+            return self._stat_cache[path]
+        except KeyError:
+            pass
+        try:
+            result: Optional[os.stat_result] = os.stat(path)
+        except OSError as exc:
+            if not is_missing_path_error(exc):
+                raise
+            result = None
+        except ValueError:
+            # Paths with embedded null bytes cannot exist
+            result = None
+        self._stat_cache[path] = result
+        return result
+
+
+@lru_cache(maxsize=None)
+def _load_pandas() -> Any:
+    """Import pandas on first use, returning None when it cannot be imported."""
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    return pd
+
+
+@lru_cache(maxsize=None)
+def _load_pyarrow_csv() -> Any:
+    """Import pyarrow.csv on first use, returning None when it cannot be imported."""
+    try:
+        import pyarrow.csv as pacsv  # type: ignore
+    except ImportError:
+        return None
+    return pacsv
+
+
+def _pandas_unavailable_issue() -> TaskIssue:
+    return TaskIssue(
+        path="runtime_validation",
+        message="pandas is not available for CSV structure validation",
+        code="csv-validation-unavailable"
+    )
+
+
+def _csv_backend() -> Any:
+    """Return the CSV reader module to use, preferring pyarrow over pandas."""
+    if PYARROW_AVAILABLE:
+        pacsv = _load_pyarrow_csv()
+        if pacsv is not None:
+            return pacsv
+    if PANDAS_AVAILABLE:
+        return _load_pandas()
+    return None
+
+
+class _EmptyCSVError(ValueError):
+    """Raised when a reference CSV has no header row to read."""
+
+
+def _read_csv_head(file_path: Path) -> Tuple[List[str], bool, Optional[Exception]]:
+    """Read a CSV header and first data row, returning ``(columns, is_empty, error)``.
+    
+    The header and one data row are enough to check columns and emptiness
+    without parsing the whole file.
+    """
+    try:
+        if PYARROW_AVAILABLE and _load_pyarrow_csv() is not None:
+            columns, is_empty = _read_csv_head_pyarrow(file_path)
+        else:
+            columns, is_empty = _read_csv_head_pandas(file_path)
+    except Exception as exc:
+        return [], False, exc
+    return columns, is_empty, None
+
+
+def _read_csv_head_pyarrow(file_path: Path) -> Tuple[List[str], bool]:
+    pacsv = _load_pyarrow_csv()
+    try:
+        reader = pacsv.open_csv(str(file_path))
+    except ValueError as exc:
+        # pyarrow raises ArrowInvalid (a ValueError) when there is no header
+        # row; a blank file is empty, as the pandas reader reports it
+        if _is_blank_file(file_path):
+            raise _EmptyCSVError(str(exc)) from exc
+        raise
+    try:
+        # Stop at the first block holding a data row
+        is_empty = all(batch.num_rows == 0 for batch in reader)
+    finally:
+        reader.close()
+    return reader.schema.names, is_empty
+
+
+def _is_blank_file(file_path: Path) -> bool:
+    """Return whether a file holds nothing but whitespace."""
+    with open(file_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(65536), b""):
+            if chunk.strip():
+                return False
+    return True
+
+
+def _read_csv_head_pandas(file_path: Path) -> Tuple[List[str], bool]:
+    pd = _load_pandas()
+    try:
+        df = pd.read_csv(file_path, dtype=str, keep_default_na=False, nrows=1, engine="c")
+    except pd.errors.EmptyDataError as exc:
+        raise _EmptyCSVError(str(exc)) from exc
+    return df.columns.tolist(), df.empty
+
+
+def _csv_schema_cache_key(cache_dir: Optional[Path], file_path: Path,
+                          file_stat: Optional[os.stat_result]) -> Optional[str]:
+    """Return the schema cache key for a CSV, or None when caching is off."""
+    if cache_dir is None or file_stat is None:
+        return None
+    identity = f"{os.path.abspath(file_path)}|{file_stat.st_mtime_ns}|{file_stat.st_size}"
+    return hashlib.sha256(identity.encode("utf-8", "surrogateescape")).hexdigest()
+
+
+def _load_csv_schema(cache_dir: Optional[Path],
+                     cache_key: Optional[str]) -> Optional[Tuple[List[str], bool, Optional[Exception]]]:
+    """Return a cached ``(columns, is_empty, None)`` head, or None on a miss."""
+    if cache_dir is None or cache_key is None:
+        return None
+    try:
+        with open(cache_dir / f"{cache_key}.json", encoding="utf-8") as handle:
+            entry = json.load(handle)
+        columns = entry["columns"]
+        is_empty = entry["empty"]
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    if not isinstance(is_empty, bool) or not isinstance(columns, list) \
+            or not all(isinstance(column, str) for column in columns):
+        return None
+    return columns, is_empty, None
+
+
+def _prune_csv_schema_cache(cache_dir: Path) -> None:
+    """Empty the schema cache once it holds the maximum number of entries.
+
+    Edited CSVs leave entries for their old modification times behind, so
+    start over rather than grow without bound.
+    """
+    try:
+        with os.scandir(cache_dir) as entries:
+            names = [entry.name for entry in entries if entry.name.endswith(".json")]
+    except OSError:
+        return
+    if len(names) < _CSV_SCHEMA_CACHE_LIMIT:
+        return
+    for name in names:
+        try:
+            os.unlink(cache_dir / name)
+        except OSError:
+            pass
+
+
+def _store_csv_schema(cache_dir: Path, cache_key: Optional[str],
+                      head: Tuple[List[str], bool, Optional[Exception]]) -> None:
+    """Write a successfully parsed head to the schema cache, ignoring failures."""
+    columns, is_empty, read_error = head
+    if cache_key is None or read_error is not None:
+        return
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump({"columns": columns, "empty": is_empty}, handle)
+        # Readers only ever see a complete entry
+        os.replace(temp_name, cache_dir / f"{cache_key}.json")
+    except (OSError, ValueError):
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
 
 
-def validate_runtime_files(config: Dict[str, Any], base_dir: Optional[Path] = None) -> FileValidationResult:
+def validate_runtime_files(config: Dict[str, Any], base_dir: Optional[Path] = None,
+                           use_cache: bool = True) -> FileValidationResult:
     """Validate runtime file dependencies.
     
     Args:
         config: Configuration dictionary to validate
         base_dir: Base directory for resolving relative paths
+        use_cache: Whether parsed CSV schemas may be read from and written to
+            the per-user cache directory
         
     Returns:
         FileValidationResult with validation findings
     """
-    validator = RuntimeFileValidator(base_dir)
+    validator = RuntimeFileValidator(base_dir, use_cache=use_cache)
     return validator.validate_file_dependencies(config)
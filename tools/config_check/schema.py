@@ -6,8 +6,10 @@ validate user-supplied configuration data and emit actionable diagnostics.
 
 from __future__ import annotations
 
+import copy
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
@@ -132,6 +134,14 @@ class WatchFolderConfig(BaseModel):
         return value.strip()
 
 
+# Common spellings of the on_error policies, resolved without normalizing
+_ON_ERROR_LOOKUP = {
+    spelling: policy
+    for policy in ("stop", "continue")
+    for spelling in (policy, policy.upper(), policy.capitalize())
+}
+
+
 class TaskDefinition(BaseModel):
     """Definition of a single task entry under tasks.*."""
 
@@ -166,6 +176,9 @@ class TaskDefinition(BaseModel):
             return value
         if not isinstance(value, str):
             raise ValueError("on_error must be 'stop' or 'continue'")
+        normalized = _ON_ERROR_LOOKUP.get(value)
+        if normalized is not None:
+            return normalized
         normalized = value.lower().strip()
         if normalized not in {"stop", "continue"}:
             raise ValueError("on_error must be 'stop' or 'continue'")
@@ -293,6 +306,12 @@ class SchemaValidationResult:
 def load_config_schema() -> Dict[str, Any]:
     """Return the JSON schema describing the configuration model."""
 
+    # Callers own the returned dict, so hand out a copy of the cached schema
+    return copy.deepcopy(_build_config_schema())
+
+
+@lru_cache(maxsize=1)
+def _build_config_schema() -> Dict[str, Any]:
     return ConfigModel.model_json_schema()
 
 
@@ -347,16 +366,17 @@ def _convert_validation_errors(exc: ValidationError) -> Iterable[SchemaValidatio
 
 
 def _format_location(location: Iterable[Any]) -> str:
-    parts: List[str] = []
+    # Indices attach to the preceding name ("items[0]"); each dotted segment
+    # is joined once rather than rebuilt for every index
+    segments: List[List[str]] = []
     for entry in location:
         if isinstance(entry, int):
-            if not parts:
-                parts.append(f"[{entry}]")
-            else:
-                parts[-1] = f"{parts[-1]}[{entry}]"
+            if not segments:
+                segments.append([])
+            segments[-1].append(f"[{entry}]")
         else:
-            parts.append(str(entry))
-    return ".".join(parts)
+            segments.append([str(entry)])
+    return ".".join("".join(segment) for segment in segments)
 
 
 def _collect_extra_fields(model: BaseModel, prefix: str = "") -> Iterable[str]:
@@ -30,12 +30,21 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass
+import re
+import stat
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .path_validator import is_missing_path_error
 
 logger = logging.getLogger(__name__)
 
+# Distinct (path, description) pairs a validator remembers analysis for
+_PATH_CACHE_LIMIT = 4096
+
 
 @dataclass(slots=True)
 class SecurityIssue:
@@ -63,24 +72,26 @@ class SecurityAnalysisResult:
 
     def add_issue(self, issue: SecurityIssue) -> None:
         """Add an issue to the appropriate severity list."""
-        if issue.severity == "error":
-            self.errors.append(issue)
-        elif issue.severity == "warning":
-            self.warnings.append(issue)
-        else:
-            self.info.append(issue)
+        self.add_issues((issue,))
+
+    def add_issues(self, issues: Iterable[SecurityIssue]) -> None:
+        """Add issues to their severity lists; unknown severities count as info."""
+        buckets = {"error": self.errors, "warning": self.warnings}
+        info = self.info
+        for issue in issues:
+            buckets.get(issue.severity, info).append(issue)
 
     @property
     def all_issues(self) -> List[SecurityIssue]:
         """Get all issues regardless of severity."""
-        return self.errors + self.warnings + self.info
+        return [*self.errors, *self.warnings, *self.info]
 
 
 class SecurityValidator:
     """Validates configuration for security issues."""
 
     # Dangerous path patterns that could indicate path traversal vulnerabilities
-    DANGEROUS_PATH_PATTERNS = {
+    DANGEROUS_PATH_PATTERNS = frozenset({
         "../",      # Unix path traversal
         "..\\",     # Windows path traversal
         "..",       # Generic parent directory reference
@@ -93,10 +104,10 @@ class SecurityValidator:
         "`",        # Command substitution
         "$(",       # Command substitution
         "${",       # Variable substitution
-    }
+    })
 
     # Additional suspicious patterns
-    SUSPICIOUS_PATTERNS = {
+    SUSPICIOUS_PATTERNS = frozenset({
         "/etc/",    # Unix system directory
         "/var/",    # Unix variable directory
         "/tmp/",    # Unix temporary directory
@@ -104,17 +115,77 @@ class SecurityValidator:
         "C:\\Program Files\\",  # Windows program directory
         "\\\\",     # UNC path indicator
         "//",       # Double slash (potential protocol confusion)
-    }
+    })
+
+    # Both pattern sets as (lowercased pattern, pattern, is_dangerous), lowered
+    # once here so a path is scanned against them in a single pass; longest
+    # first so the scan order does not depend on set iteration order
+    _PATTERN_TABLE = tuple(sorted(
+        [(pattern.lower(), pattern, True) for pattern in DANGEROUS_PATH_PATTERNS]
+        + [(pattern.lower(), pattern, False) for pattern in SUSPICIOUS_PATTERNS],
+        key=lambda entry: (-len(entry[0]), entry[0]),
+    ))
+
+    # Matches a lowercased path containing any pattern of either set; most
+    # paths match none and skip the per-pattern scan
+    _ANY_PATTERN_RE = re.compile("|".join(re.escape(pattern_lower) for pattern_lower, _, _ in _PATTERN_TABLE))
+
+    # Lowercased system directories an absolute path should generally avoid
+    UNSAFE_ABSOLUTE_PATTERNS = (
+        "c:\\windows\\",
+        "c:\\program files\\",
+        "/etc/",
+        "/var/",
+        "/usr/",
+        "/bin/",
+        "/sbin/",
+    )
+    _UNSAFE_ABSOLUTE_RE = re.compile("|".join(map(re.escape, UNSAFE_ABSOLUTE_PATTERNS)))
+
+    # Matches a lowercased path that could raise any path finding: a pattern
+    # of either set ("..", which the relative check looks for, is one of
+    # them) or an unsafe absolute location
+    _ANY_FINDING_RE = re.compile("|".join(map(re.escape, sorted(
+        {pattern_lower for pattern_lower, _, _ in _PATTERN_TABLE} | set(UNSAFE_ABSOLUTE_PATTERNS),
+        key=lambda pattern: (-len(pattern), pattern),
+    ))))
+
+    # Dangerous patterns that escalate a path finding from warning to error
+    _TRAVERSAL_PATTERNS = frozenset({"../", "..\\", ".."})
+
+    # Punctuation drawn from every pattern above; each pattern holds at least
+    # one, so a path without any of them cannot raise a path finding
+    _PATTERN_MARK_CHARS = frozenset(
+        char
+        for pattern in (*(entry[0] for entry in _PATTERN_TABLE), *UNSAFE_ABSOLUTE_PATTERNS)
+        for char in pattern
+        if not char.isalnum() and not char.isspace()
+    )
+
+    # Lowercased temporary directories that make unsafe homes for configured folders
+    UNSAFE_DIRECTORY_LOCATIONS = (
+        "c:\\windows\\temp",
+        "c:\\temp",
+        "/tmp",
+        "/var/tmp",
+    )
+    _UNSAFE_LOCATION_RE = re.compile("|".join(map(re.escape, UNSAFE_DIRECTORY_LOCATIONS)))
 
     # Path parameters commonly found in task configurations
-    PATH_PARAMETERS = {
+    PATH_PARAMETERS = frozenset({
         "data_dir", "files_dir", "reference_file", "processing_dir",
         "archive_dir", "upload_dir", "dir", "filename", "output_dir",
         "input_dir", "temp_dir", "log_dir", "backup_dir"
-    }
+    })
+
+    # Path parameters of a task's nested storage mapping
+    STORAGE_PATH_PARAMETERS = frozenset({"data_dir", "filename"})
 
     def __init__(self) -> None:
         self.logger = logger.getChild(self.__class__.__name__)
+        # Path analysis depends only on the path and its description, so
+        # issues are built once per pair and re-stamped with each config path
+        self._path_cache: Dict[tuple[str, str], tuple[SecurityIssue, ...]] = {}
 
     def validate_security(self, config: Dict[str, Any]) -> SecurityAnalysisResult:
         """Validate configuration for security issues."""
@@ -122,19 +193,13 @@ class SecurityValidator:
         result = SecurityAnalysisResult()
 
         # Validate file path security
-        path_issues = self._validate_path_security(config)
-        for issue in path_issues:
-            result.add_issue(issue)
+        result.add_issues(self._validate_path_security(config))
 
         # Validate directory configurations
-        directory_issues = self._validate_directory_security(config)
-        for issue in directory_issues:
-            result.add_issue(issue)
+        result.add_issues(self._validate_directory_security(config))
 
         # Validate task-specific security
-        task_issues = self._validate_task_security(config)
-        for issue in task_issues:
-            result.add_issue(issue)
+        result.add_issues(self._validate_task_security(config))
 
         self.logger.debug(
             "Security analysis complete: %d errors, %d warnings, %d info",
@@ -202,56 +267,77 @@ class SecurityValidator:
 
     def _validate_task_security(self, config: Dict[str, Any]) -> List[SecurityIssue]:
         """Validate task-specific paths for security issues."""
-        issues: List[SecurityIssue] = []
         tasks = config.get("tasks", {})
-
-        for task_name, task_config in tasks.items():
-            if not isinstance(task_config, dict):
-                continue
-
-            params = task_config.get("params", {})
-            if not isinstance(params, dict):
-                continue
-
-            # Check common path parameters
-            for param_name in self.PATH_PARAMETERS:
-                if param_name in params:
-                    param_value = params[param_name]
-                    if isinstance(param_value, str) and param_value:
-                        path_issues = self._analyze_path_security(
-                            f"tasks.{task_name}.params.{param_name}",
-                            param_value,
-                            f"task parameter '{param_name}'"
-                        )
-                        issues.extend(path_issues)
-
-            # Check nested storage parameters
-            storage_config = params.get("storage", {})
-            if isinstance(storage_config, dict):
-                for storage_param in ["data_dir", "filename"]:
-                    if storage_param in storage_config:
-                        param_value = storage_config[storage_param]
-                        if isinstance(param_value, str) and param_value:
-                            path_issues = self._analyze_path_security(
-                                f"tasks.{task_name}.params.storage.{storage_param}",
-                                param_value,
-                                f"storage parameter '{storage_param}'"
-                            )
-                            issues.extend(path_issues)
-
-        return issues
+        return list(chain.from_iterable(
+            self._analyze_task_security(task_name, task_config)
+            for task_name, task_config in tasks.items()
+        ))
+
+    def _analyze_task_security(self, task_name: str, task_config: Any) -> Iterator[SecurityIssue]:
+        """Yield the security issues for the path parameters of one task."""
+        if not isinstance(task_config, dict):
+            return
+
+        params = task_config.get("params", {})
+        if not isinstance(params, dict):
+            return
+
+        # Check common path parameters, in the order the task lists them;
+        # params are usually far fewer than PATH_PARAMETERS
+        path_parameters = self.PATH_PARAMETERS
+        for param_name, param_value in params.items():
+            if param_name in path_parameters and isinstance(param_value, str) and param_value:
+                yield from self._analyze_path_security(
+                    f"tasks.{task_name}.params.{param_name}",
+                    param_value,
+                    f"task parameter '{param_name}'"
+                )
+
+        # Check nested storage parameters
+        storage_config = params.get("storage")
+        if isinstance(storage_config, dict):
+            for storage_param, param_value in storage_config.items():
+                if storage_param in self.STORAGE_PATH_PARAMETERS and isinstance(param_value, str) and param_value:
+                    yield from self._analyze_path_security(
+                        f"tasks.{task_name}.params.storage.{storage_param}",
+                        param_value,
+                        f"storage parameter '{storage_param}'"
+                    )
 
     def _analyze_path_security(self, config_path: str, path_value: str, description: str) -> List[SecurityIssue]:
         """Analyze a single path for security issues."""
+        key = (path_value, description)
+        cached = self._path_cache.get(key)
+        if cached is None:
+            # Long-lived validators start over rather than grow without bound
+            if len(self._path_cache) >= _PATH_CACHE_LIMIT:
+                self._path_cache.clear()
+            cached = self._path_cache[key] = tuple(self._build_path_issues(path_value, description))
+        return [replace(issue, path=config_path, details=_copy_details(issue.details)) for issue in cached]
+
+    def _build_path_issues(self, path_value: str, description: str) -> List[SecurityIssue]:
+        """Build the issues for a path, leaving the config path to the caller."""
+        # Bare names such as "processing" hold none of the pattern punctuation
+        if self._PATTERN_MARK_CHARS.isdisjoint(path_value):
+            return []
+
+        path_lower = path_value.lower()
+
+        # Most paths match nothing and are not rooted, which rules out every
+        # finding below, absolute or relative
+        if self._ANY_FINDING_RE.search(path_lower) is None and not path_value.startswith(("/", "\\")):
+            return []
+
         issues: List[SecurityIssue] = []
+        label = description.capitalize()
 
         # Check for dangerous path traversal patterns
-        dangerous_patterns = self._find_dangerous_patterns(path_value)
+        dangerous_patterns, suspicious_patterns = self._scan_path_patterns(path_lower)
         if dangerous_patterns:
-            severity = "error" if any(p in ["../", "..\\", ".."] for p in dangerous_patterns) else "warning"
+            severity = "warning" if self._TRAVERSAL_PATTERNS.isdisjoint(dangerous_patterns) else "error"
             issues.append(SecurityIssue(
-                path=config_path,
-                message=f"{description.capitalize()} path '{path_value}' contains potentially dangerous patterns: {', '.join(dangerous_patterns)}. "
+                path="",
+                message=f"{label} path '{path_value}' contains potentially dangerous patterns: {', '.join(dangerous_patterns)}. "
                        f"This may be vulnerable to path traversal attacks.",
                 code="security-path-traversal-risk",
                 severity=severity,
@@ -263,11 +349,10 @@ class SecurityValidator:
             ))
 
         # Check for suspicious system paths
-        suspicious_patterns = self._find_suspicious_patterns(path_value)
         if suspicious_patterns:
             issues.append(SecurityIssue(
-                path=config_path,
-                message=f"{description.capitalize()} path '{path_value}' references system directories: {', '.join(suspicious_patterns)}. "
+                path="",
+                message=f"{label} path '{path_value}' references system directories: {', '.join(suspicious_patterns)}. "
                        f"Ensure this is intentional and properly secured.",
                 code="security-suspicious-system-path",
                 severity="warning",
@@ -281,10 +366,10 @@ class SecurityValidator:
         # Check for absolute vs relative path security implications
         if os.path.isabs(path_value):
             # Absolute paths can be more secure but need validation
-            if self._is_potentially_unsafe_absolute_path(path_value):
+            if self._is_potentially_unsafe_absolute_path(path_lower):
                 issues.append(SecurityIssue(
-                    path=config_path,
-                    message=f"{description.capitalize()} uses absolute path '{path_value}' that may pose security risks. "
+                    path="",
+                    message=f"{label} uses absolute path '{path_value}' that may pose security risks. "
                            f"Ensure the path is within expected boundaries.",
                     code="security-unsafe-absolute-path",
                     severity="info",
@@ -298,8 +383,8 @@ class SecurityValidator:
             # Relative paths need careful handling
             if self._is_potentially_unsafe_relative_path(path_value):
                 issues.append(SecurityIssue(
-                    path=config_path,
-                    message=f"{description.capitalize()} uses relative path '{path_value}' that may escape intended boundaries. "
+                    path="",
+                    message=f"{label} uses relative path '{path_value}' that may escape intended boundaries. "
                            f"Consider using absolute paths or additional validation.",
                     code="security-unsafe-relative-path",
                     severity="warning",
@@ -321,36 +406,31 @@ class SecurityValidator:
             resolved_path = Path(directory_path).resolve()
             
             # Check if directory exists and we can analyze it
-            if resolved_path.exists() and resolved_path.is_dir():
+            if _is_existing_directory(resolved_path):
                 # On Windows, we have limited permission checking capabilities
                 # But we can still check for some basic security issues
                 
                 # Check if the directory is in a potentially unsafe location
                 path_str = str(resolved_path).lower()
                 
-                # Check for directories in system locations
-                unsafe_locations = [
-                    "c:\\windows\\temp",
-                    "c:\\temp",
-                    "/tmp",
-                    "/var/tmp"
-                ]
-                
-                for unsafe_location in unsafe_locations:
-                    if unsafe_location in path_str:
-                        issues.append(SecurityIssue(
-                            path=config_path,
-                            message=f"Directory '{directory_path}' is located in a potentially unsafe system location. "
-                                   f"Consider using a more secure location.",
-                            code="security-unsafe-directory-location",
-                            severity="warning",
-                            details={
-                                "path": directory_path,
-                                "resolved_path": str(resolved_path),
-                                "unsafe_location": unsafe_location
-                            }
-                        ))
-                        break
+                # Check for directories in system locations; the first listed
+                # location found is the one reported
+                if self._UNSAFE_LOCATION_RE.search(path_str) is not None:
+                    unsafe_location = next(
+                        location for location in self.UNSAFE_DIRECTORY_LOCATIONS if location in path_str
+                    )
+                    issues.append(SecurityIssue(
+                        path=config_path,
+                        message=f"Directory '{directory_path}' is located in a potentially unsafe system location. "
+                               f"Consider using a more secure location.",
+                        code="security-unsafe-directory-location",
+                        severity="warning",
+                        details={
+                            "path": directory_path,
+                            "resolved_path": str(resolved_path),
+                            "unsafe_location": unsafe_location
+                        }
+                    ))
 
         except (OSError, ValueError) as e:
             # If we can't analyze the directory, note it as an info item
@@ -368,44 +448,37 @@ class SecurityValidator:
 
         return issues
 
-    def _find_dangerous_patterns(self, path: str) -> Set[str]:
+    def _scan_path_patterns(self, path_lower: str) -> Tuple[List[str], List[str]]:
+        """Find dangerous and suspicious patterns in an already lowercased path.
+
+        Patterns are listed in order of first appearance in the path, longer
+        patterns first when several start at the same position, so messages
+        and details are stable from run to run.
+        """
+        if self._ANY_PATTERN_RE.search(path_lower) is None:
+            return [], []
+        found = []
+        for pattern_lower, pattern, is_dangerous in self._PATTERN_TABLE:
+            position = path_lower.find(pattern_lower)
+            if position >= 0:
+                found.append((position, -len(pattern_lower), pattern, is_dangerous))
+        found.sort()
+        dangerous = [pattern for _, _, pattern, is_dangerous in found if is_dangerous]
+        suspicious = [pattern for _, _, pattern, is_dangerous in found if not is_dangerous]
+        return dangerous, suspicious
+
+    def _find_dangerous_patterns(self, path: str) -> List[str]:
         """Find dangerous patterns in a path string."""
-        found_patterns = set()
-        path_lower = path.lower()
-        
-        for pattern in self.DANGEROUS_PATH_PATTERNS:
-            if pattern.lower() in path_lower:
-                found_patterns.add(pattern)
-        
-        return found_patterns
+        return self._scan_path_patterns(path.lower())[0]
 
-    def _find_suspicious_patterns(self, path: str) -> Set[str]:
+    def _find_suspicious_patterns(self, path: str) -> List[str]:
         """Find suspicious system path patterns."""
-        found_patterns = set()
-        path_lower = path.lower()
-        
-        for pattern in self.SUSPICIOUS_PATTERNS:
-            if pattern.lower() in path_lower:
-                found_patterns.add(pattern)
-        
-        return found_patterns
+        return self._scan_path_patterns(path.lower())[1]
 
-    def _is_potentially_unsafe_absolute_path(self, path: str) -> bool:
-        """Check if an absolute path is potentially unsafe."""
-        path_lower = path.lower()
-        
+    def _is_potentially_unsafe_absolute_path(self, path_lower: str) -> bool:
+        """Check if an already lowercased absolute path is potentially unsafe."""
         # Check for system directories that should generally be avoided
-        unsafe_absolute_patterns = [
-            "c:\\windows\\",
-            "c:\\program files\\",
-            "/etc/",
-            "/var/",
-            "/usr/",
-            "/bin/",
-            "/sbin/"
-        ]
-        
-        return any(pattern in path_lower for pattern in unsafe_absolute_patterns)
+        return self._UNSAFE_ABSOLUTE_RE.search(path_lower) is not None
 
     def _is_potentially_unsafe_relative_path(self, path: str) -> bool:
         """Check if a relative path is potentially unsafe."""
@@ -413,7 +486,31 @@ class SecurityValidator:
         return ".." in path or path.startswith("/") or path.startswith("\\")
 
 
+def _copy_details(details: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Copy cached issue details, including their pattern lists, for one caller."""
+    if details is None:
+        return None
+    return {key: list(value) if isinstance(value, list) else value for key, value in details.items()}
+
+
+def _is_existing_directory(path: Path) -> bool:
+    """Return whether a path is an existing directory, using a single stat."""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError as exc:
+        if is_missing_path_error(exc):
+            return False
+        raise
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=1)
+def _default_validator() -> SecurityValidator:
+    """Return the validator shared by calls to validate_security()."""
+    return SecurityValidator()
+
+
 def validate_security(config: Dict[str, Any]) -> SecurityAnalysisResult:
     """Convenience function to validate configuration security."""
-    validator = SecurityValidator()
-    return validator.validate_security(config)
\ No newline at end of file
+    return _default_validator().validate_security(config)
\ No newline at end of file
@@ -252,6 +252,34 @@ def _suggest_secure_directory_location(details: Dict[str, Any]) -> str:
     return f"Consider moving '{path}' to a more secure location outside of system directories."
 
 
+# Suggestions that do not depend on the finding's details
+_STATIC_SUGGESTIONS: Dict[str, str] = {
+    "pipeline-entry-invalid": "Ensure pipeline entries are task ids (non-empty strings).",
+    "pipeline-not-list": "Define pipeline as a list of task identifiers in execution order.",
+    "tasks-not-mapping": "Define the tasks section as a mapping of task ids to definitions.",
+    "task-import-invalid-module": "Provide a module path string (e.g., standard_step.extraction.extract_pdf).",
+    "task-import-invalid-class": "Provide a class name string matching the task implementation.",
+    "param-extraction-not-mapping": "Define params as a mapping of parameter names to values for this extraction task.",
+    "param-extraction-missing-fields": "Add a 'fields' mapping describing the data to extract.",
+    "param-rules-not-mapping": "Define this task's params as a mapping that includes reference_file, update_field, and csv_match.",
+    "param-rules-missing-reference-file": "Set reference_file to the CSV file that should be updated.",
+    "param-rules-missing-update-field": "Set update_field to the column name that must be updated.",
+    "param-rules-csv-match-mapping": "Provide a csv_match mapping with a type and clauses list.",
+    "param-rules-csv-type": "Set csv_match.type to 'column_equals_all'.",
+    "param-rules-clauses-type": "Define csv_match.clauses as a list of clause mappings.",
+    "param-rules-clauses-count": "Provide between 1 and 5 clause definitions in csv_match.clauses.",
+    "param-storage-missing-data-dir": "Set data_dir to the output directory (e.g., ./output).",
+    "param-storage-missing-filename": "Provide a filename pattern (e.g., {supplier_name}.json).",
+    "param-archiver-missing-archive-dir": "Set archive_dir to the folder for archived files.",
+    "param-context-length-type": "Set length to an integer between 5 and 21.",
+    # Performance analysis suggestions
+    "performance-complex-field-patterns": "Consider simplifying complex extraction patterns for better performance.",
+    "performance-complex-context-paths": "Consider using simpler context paths to improve rules processing speed.",
+    "performance-excessive-string-comparisons": "Consider using numeric comparisons where possible for better performance.",
+    # Security analysis suggestions
+    "security-directory-analysis-failed": "Ensure the directory exists and is accessible for security analysis.",
+}
+
 _SUGGESTION_HANDLERS: Dict[str, SuggestionHandler] = {
     "path-missing-dir": _suggest_create_dir,
     "path-not-dir": _suggest_directory_type,
@@ -261,7 +289,6 @@ _SUGGESTION_HANDLERS: Dict[str, SuggestionHandler] = {
     "path-value-type": _suggest_required_string,
     "path-value-empty": _suggest_required_string,
     "watch-folder-missing-dir": _suggest_watch_folder,
-    "pipeline-entry-invalid": lambda _: "Ensure pipeline entries are task ids (non-empty strings).",
     "pipeline-missing-task": _suggest_pipeline_missing_task,
     "pipeline-duplicate-task": _suggest_pipeline_duplicate,
     "pipeline-storage-before-extraction": _suggest_pipeline_storage,
@@ -270,17 +297,10 @@ _SUGGESTION_HANDLERS: Dict[str, SuggestionHandler] = {
     "pipeline-nanoid-before-context": _suggest_pipeline_nanoid,
     "pipeline-missing-extraction": _suggest_pipeline_missing_extraction,
     "pipeline-unknown-token": _suggest_unknown_token,
-    "pipeline-not-list": lambda _: "Define pipeline as a list of task identifiers in execution order.",
-    "tasks-not-mapping": lambda _: "Define the tasks section as a mapping of task ids to definitions.",
     "task-definition-not-mapping": lambda d: f"Define tasks.{d.get('task_name', 'task')} as a mapping with module, class, and params.",
-    "task-import-invalid-module": lambda _: "Provide a module path string (e.g., standard_step.extraction.extract_pdf).",
-    "task-import-invalid-class": lambda _: "Provide a class name string matching the task implementation.",
     "task-import-module": _suggest_import_module,
     "task-import-class": _suggest_import_class,
     "task-import-not-class": _suggest_import_not_class,
-    "pipeline-duplicate-task": _suggest_pipeline_duplicate,
-    "param-extraction-not-mapping": lambda _: "Define params as a mapping of parameter names to values for this extraction task.",
-    "param-extraction-missing-fields": lambda _: "Add a 'fields' mapping describing the data to extract.",
     "param-field-invalid": lambda d: f"Define field '{d.get('field', 'field')}' as a mapping with alias and type.",
     "param-field-missing-alias": _suggest_field_alias,
     "param-field-invalid-type": _suggest_field_type,
@@ -290,22 +310,11 @@ _SUGGESTION_HANDLERS: Dict[str, SuggestionHandler] = {
     "param-field-object-fields-type": lambda d: f"Set field '{d.get('field', 'field')}' to Dict[str, Any] or remove object_fields.",
     "param-field-invalid-object-child-type": lambda d: f"Use str, int, float, or bool for object property '{d.get('field', 'field')}'.",
     "param-extraction-multiple-tables": _suggest_multiple_tables,
-    "param-rules-not-mapping": lambda _: "Define this task's params as a mapping that includes reference_file, update_field, and csv_match.",
-    "param-rules-missing-reference-file": lambda _: "Set reference_file to the CSV file that should be updated.",
-    "param-rules-missing-update-field": lambda _: "Set update_field to the column name that must be updated.",
-    "param-rules-csv-match-mapping": lambda _: "Provide a csv_match mapping with a type and clauses list.",
-    "param-rules-csv-type": lambda _: "Set csv_match.type to 'column_equals_all'.",
-    "param-rules-clauses-type": lambda _: "Define csv_match.clauses as a list of clause mappings.",
-    "param-rules-clauses-count": lambda _: "Provide between 1 and 5 clause definitions in csv_match.clauses.",
     "param-rules-clause-not-mapping": lambda d: f"Ensure {_describe_clause(d)} is a mapping with column and from_context entries.",
     "param-rules-clause-column": lambda d: f"Provide a non-empty column value for {_describe_clause(d)}.",
     "param-rules-clause-context": lambda d: f"Provide a non-empty from_context value for {_describe_clause(d)}.",
     "param-rules-clause-number-type": lambda d: f"Set number on {_describe_clause(d)} to true/false or remove it.",
-    "param-storage-missing-data-dir": lambda _: "Set data_dir to the output directory (e.g., ./output).",
-    "param-storage-missing-filename": lambda _: "Provide a filename pattern (e.g., {supplier_name}.json).",
-    "param-archiver-missing-archive-dir": lambda _: "Set archive_dir to the folder for archived files.",
     "param-not-mapping": lambda d: f"Define {d.get('config_key', 'these parameters')} as a mapping of names to values.",
-    "param-context-length-type": lambda _: "Set length to an integer between 5 and 21.",
     "param-context-length-bounds": _suggest_context_length,
     # Performance analysis suggestions
     "performance-excessive-fields": _suggest_reduce_extraction_fields,
@@ -316,16 +325,12 @@ _SUGGESTION_HANDLERS: Dict[str, SuggestionHandler] = {
     "performance-excessive-pipeline-length-critical": _suggest_optimize_pipeline,
     "performance-multiple-extraction-tasks": _suggest_reduce_extraction_tasks,
     "performance-multiple-rules-tasks": _suggest_consolidate_rules,
-    "performance-complex-field-patterns": lambda _: "Consider simplifying complex extraction patterns for better performance.",
-    "performance-complex-context-paths": lambda _: "Consider using simpler context paths to improve rules processing speed.",
-    "performance-excessive-string-comparisons": lambda _: "Consider using numeric comparisons where possible for better performance.",
     # Security analysis suggestions
     "security-path-traversal-risk": _suggest_fix_path_traversal,
     "security-suspicious-system-path": _suggest_secure_system_path,
     "security-unsafe-absolute-path": _suggest_secure_absolute_path,
     "security-unsafe-relative-path": _suggest_secure_relative_path,
     "security-unsafe-directory-location": _suggest_secure_directory_location,
-    "security-directory-analysis-failed": lambda _: "Ensure the directory exists and is accessible for security analysis.",
 }
 
 
@@ -334,6 +339,10 @@ def get_suggestion(code: Optional[str], details: Optional[Dict[str, Any]] = None
     if not code:
         return None
 
+    suggestion = _STATIC_SUGGESTIONS.get(code)
+    if suggestion is not None:
+        return suggestion
+
     handler = _SUGGESTION_HANDLERS.get(code)
     if not handler:
         return None
@@ -38,9 +38,16 @@ Note:
 from __future__ import annotations
 
 import importlib
-import inspect
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+
+# Outcome of importing a task module: the module, or the exception the import raised
+_ImportOutcome = Union[ModuleType, Exception]
+
+# Stands in for a class attribute the task module does not define
+_MISSING = object()
 
 
 @dataclass(slots=True)
@@ -78,11 +85,10 @@ def validate_tasks(
 
     if isinstance(pipeline, list):
         for idx, entry in enumerate(pipeline):
-            path = f"pipeline[{idx}]"
             if not isinstance(entry, str) or not entry.strip():
                 errors.append(
                     TaskIssue(
-                        path=path,
+                        path=f"pipeline[{idx}]",
                         message="Pipeline entries must be non-empty strings referencing task ids",
                         code="pipeline-entry-invalid",
                         details={"entry": entry},
@@ -92,7 +98,7 @@ def validate_tasks(
             if entry not in tasks:
                 errors.append(
                     TaskIssue(
-                        path=path,
+                        path=f"pipeline[{idx}]",
                         message=f"Task name '{entry}' not found under tasks. Add tasks.{entry} or remove it from pipeline.",
                         code="pipeline-missing-task",
                         details={"task_name": entry},
@@ -113,33 +119,32 @@ def validate_tasks(
     return TaskValidationResult(errors=errors, warnings=warnings)
 
 
-def _run_import_checks(tasks: Dict[str, Any]) -> List[TaskIssue]:
+def _run_import_checks(tasks: Dict[str, Any]) -> Iterator[TaskIssue]:
     """Enhanced import validation with better error reporting."""
-    findings: List[TaskIssue] = []
+    # Tasks commonly share a module; attempt each import once per run
+    modules: Dict[str, _ImportOutcome] = {}
 
     for task_name, task_config in tasks.items():
+        task_path = f"tasks.{task_name}"
+
         # Validate task structure
-        validation_result = _validate_task_structure(task_name, task_config)
-        findings.extend(validation_result)
-        
+        validation_result = _validate_task_structure(task_name, task_path, task_config)
         if validation_result:  # Skip import checks if structure is invalid
+            yield from validation_result
             continue
             
         # Perform import validation
-        import_result = _validate_task_imports(task_name, task_config)
-        findings.extend(import_result)
-
-    return findings
+        yield from _validate_task_imports(task_name, task_path, task_config, modules)
 
 
-def _validate_task_structure(task_name: str, task_config: Any) -> List[TaskIssue]:
+def _validate_task_structure(task_name: str, task_path: str, task_config: Any) -> List[TaskIssue]:
     """Validate task definition structure."""
     findings: List[TaskIssue] = []
     
     if not isinstance(task_config, dict):
         findings.append(
             TaskIssue(
-                path=f"tasks.{task_name}",
+                path=task_path,
                 message="Task definition must be a mapping",
                 code="task-definition-not-mapping",
                 details={"task_name": task_name},
@@ -149,7 +154,6 @@ def _validate_task_structure(task_name: str, task_config: Any) -> List[TaskIssue
 
     module_name = task_config.get("module")
     class_name = task_config.get("class")
-    task_path = f"tasks.{task_name}"
 
     if not module_name or not isinstance(module_name, str):
         findings.append(
@@ -174,136 +178,136 @@ def _validate_task_structure(task_name: str, task_config: Any) -> List[TaskIssue
     return findings
 
 
-def _validate_task_imports(task_name: str, task_config: Dict[str, Any]) -> List[TaskIssue]:
+def _validate_task_imports(
+    task_name: str, task_path: str, task_config: Dict[str, Any], modules: Dict[str, _ImportOutcome]
+) -> Iterator[TaskIssue]:
     """Validate task module and class imports with detailed error handling."""
-    findings: List[TaskIssue] = []
-    
     module_name = task_config.get("module")
     class_name = task_config.get("class")
 
     if not isinstance(module_name, str) or not module_name:
-        return findings
+        return
     if not isinstance(class_name, str) or not class_name:
-        return findings
+        return
     
     # Validate module import
-    module_issue = _validate_module_import(module_name, task_name)
-    if module_issue:
-        findings.append(module_issue)
-        return findings  # Skip class validation if module import fails
+    module, module_issue = _validate_module_import(module_name, task_name, task_path, modules)
+    if module is None:
+        if module_issue:
+            yield module_issue
+        return  # Skip class validation if module import fails
     
     # Validate class existence and type
-    class_issue = _validate_class_existence(module_name, class_name, task_name)
+    task_class, class_issue = _validate_class_existence(module, module_name, class_name, task_name, task_path)
     if class_issue:
-        findings.append(class_issue)
-        return findings
+        yield class_issue
+        return
     
     # Validate class type
-    type_issue = _validate_class_type(module_name, class_name, task_name)
+    type_issue = _validate_class_type(task_class, module_name, class_name, task_name, task_path)
     if type_issue:
-        findings.append(type_issue)
-    
-    return findings
-
-
-def _validate_module_import(module_name: str, task_name: str) -> Optional[TaskIssue]:
-    """Validate that a module can be imported with detailed error reporting."""
+        yield type_issue
+
+
+def _cached_import(module_name: str, modules: Dict[str, _ImportOutcome]) -> ModuleType:
+    """Import a module, replaying the outcome of an earlier attempt in this run."""
+    outcome = modules.get(module_name)
+    if outcome is None:
+        try:
+            outcome = importlib.import_module(module_name)
+        except Exception as exc:
+            # Python does not remember failed imports, so every retry would
+            # search sys.path (or re-execute a broken module) again
+            modules[module_name] = exc
+            raise
+        modules[module_name] = outcome
+    elif isinstance(outcome, Exception):
+        raise outcome.with_traceback(None)
+    return outcome
+
+
+def _validate_module_import(
+    module_name: str, task_name: str, task_path: str, modules: Dict[str, _ImportOutcome]
+) -> Tuple[Optional[ModuleType], Optional[TaskIssue]]:
+    """Import a task module, returning it or an issue with detailed error reporting."""
     try:
-        importlib.import_module(module_name)
-        return None
+        return _cached_import(module_name, modules), None
     except ModuleNotFoundError as exc:
-        return TaskIssue(
-            path=f"tasks.{task_name}.module",
+        return None, TaskIssue(
+            path=f"{task_path}.module",
             message=f"Module '{module_name}' not found: {exc}. Check PYTHONPATH and module installation.",
             code="task-import-module-not-found",
             details={"module": module_name, "task_name": task_name, "error": str(exc)}
         )
     except SyntaxError as exc:
-        return TaskIssue(
-            path=f"tasks.{task_name}.module",
+        return None, TaskIssue(
+            path=f"{task_path}.module",
             message=f"Module '{module_name}' has syntax errors: {exc}",
             code="task-import-module-syntax-error",
             details={"module": module_name, "task_name": task_name, "error": str(exc)}
         )
     except ImportError as exc:
-        return TaskIssue(
-            path=f"tasks.{task_name}.module",
+        return None, TaskIssue(
+            path=f"{task_path}.module",
             message=f"Failed to import module '{module_name}': {exc}. Check module dependencies.",
             code="task-import-module-import-error",
             details={"module": module_name, "task_name": task_name, "error": str(exc)}
         )
     except Exception as exc:
-        return TaskIssue(
-            path=f"tasks.{task_name}.module",
+        return None, TaskIssue(
+            path=f"{task_path}.module",
             message=f"Unexpected error importing module '{module_name}': {exc}",
             code="task-import-module-error",
             details={"module": module_name, "task_name": task_name, "error": str(exc)}
         )
 
 
-def _validate_class_existence(module_name: str, class_name: str, task_name: str) -> Optional[TaskIssue]:
-    """Validate that a class exists in the specified module."""
-    try:
-        module = importlib.import_module(module_name)
-    except Exception as exc:
-        return TaskIssue(
-            path=f"tasks.{task_name}.class",
-            message=f"Error importing module '{module_name}' while checking class '{class_name}': {exc}",
-            code="task-import-class-access-error",
-            details={"module": module_name, "class": class_name, "task_name": task_name, "error": str(exc)}
-        )
-
-    try:
-        getattr(module, class_name)
-        return None
-    except AttributeError:
-        # Get available attributes for better error message
-        available_attrs = [attr for attr in dir(module) if not attr.startswith('_')]
+def _validate_class_existence(
+    module: ModuleType, module_name: str, class_name: str, task_name: str, task_path: str
+) -> Tuple[Any, Optional[TaskIssue]]:
+    """Look up a class in the specified module, returning it or a not-found issue."""
+    task_class = getattr(module, class_name, _MISSING)
+    if task_class is not _MISSING:
+        return task_class, None
+
+    # Get available attributes for better error message
+    available_attrs = [attr for attr in dir(module) if not attr.startswith('_')]
+    return None, TaskIssue(
+        path=f"{task_path}.class",
+        message=(
+            f"Class '{class_name}' not found in module '{module_name}'. "
+            f"Available attributes: {', '.join(available_attrs[:5])}{'...' if len(available_attrs) > 5 else ''}. "
+            "Verify the class name or update the configuration."
+        ),
+        code="task-import-class-not-found",
+        details={
+            "module": module_name, 
+            "class": class_name, 
+            "task_name": task_name,
+            "available_attributes": available_attrs
+        }
+    )
+
+
+def _validate_class_type(
+    attr: Any, module_name: str, class_name: str, task_name: str, task_path: str
+) -> Optional[TaskIssue]:
+    """Validate that the specified attribute is actually a callable class."""
+    if not isinstance(attr, type):
+        attr_type = type(attr).__name__
         return TaskIssue(
-            path=f"tasks.{task_name}.class",
+            path=f"{task_path}.class",
             message=(
-                f"Class '{class_name}' not found in module '{module_name}'. "
-                f"Available attributes: {', '.join(available_attrs[:5])}{'...' if len(available_attrs) > 5 else ''}. "
-                "Verify the class name or update the configuration."
+                f"Attribute '{class_name}' in module '{module_name}' is not a class (found {attr_type}). "
+                "Ensure the configuration references a callable task class."
             ),
-            code="task-import-class-not-found",
+            code="task-import-not-callable",
             details={
                 "module": module_name, 
                 "class": class_name, 
                 "task_name": task_name,
-                "available_attributes": available_attrs
+                "actual_type": attr_type
             }
         )
-
-
-def _validate_class_type(module_name: str, class_name: str, task_name: str) -> Optional[TaskIssue]:
-    """Validate that the specified attribute is actually a callable class."""
-    try:
-        module = importlib.import_module(module_name)
-        attr = getattr(module, class_name)
-        
-        if not inspect.isclass(attr):
-            attr_type = type(attr).__name__
-            return TaskIssue(
-                path=f"tasks.{task_name}.class",
-                message=(
-                    f"Attribute '{class_name}' in module '{module_name}' is not a class (found {attr_type}). "
-                    "Ensure the configuration references a callable task class."
-                ),
-                code="task-import-not-callable",
-                details={
-                    "module": module_name, 
-                    "class": class_name, 
-                    "task_name": task_name,
-                    "actual_type": attr_type
-                }
-            )
-        
-        return None
-    except Exception as exc:
-        return TaskIssue(
-            path=f"tasks.{task_name}.class",
-            message=f"Error validating class type for '{class_name}' in module '{module_name}': {exc}",
-            code="task-import-class-type-error",
-            details={"module": module_name, "class": class_name, "task_name": task_name, "error": str(exc)}
-        )
+    
+    return None
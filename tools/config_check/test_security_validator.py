@@ -130,6 +130,23 @@ class TestSecurityValidator(unittest.TestCase):
         self.assertIn("../../../var/log", paths_flagged)
         self.assertIn("../../output.json", paths_flagged)
 
+    def test_shared_path_reported_per_parameter(self):
+        """Test a path shared by several tasks is reported at each config path."""
+        config = {
+            "tasks": {
+                "first": {"params": {"data_dir": "../shared"}},
+                "second": {"params": {"data_dir": "../shared"}},
+            }
+        }
+
+        result = self.validator.validate_security(config)
+        again = self.validator.validate_security(config)
+
+        flagged = sorted(e.path for e in result.errors)
+        self.assertEqual(flagged, ["tasks.first.params.data_dir", "tasks.second.params.data_dir"])
+        self.assertEqual(sorted(e.path for e in again.errors), flagged)
+        self.assertIsNot(result.errors[0].details, result.errors[1].details)
+
     def test_command_injection_patterns(self):
         """Test detection of potential command injection patterns."""
         config = {
@@ -183,6 +200,38 @@ class TestSecurityValidator(unittest.TestCase):
         self.assertIn("$", all_patterns)
         self.assertIn("%", all_patterns)
 
+    def test_patterns_reported_in_path_order(self):
+        """Test detected patterns are listed in order of appearance in the path."""
+        config = {"web": {"upload_dir": "$HOME/../data;x"}}
+
+        result = self.validator.validate_security(config)
+
+        self.assertEqual(len(result.errors), 1)
+        details = result.errors[0].details
+        self.assertIsNotNone(details)
+        assert details is not None
+        self.assertEqual(details["dangerous_patterns"], ["$", "../", "..", ";"])
+        self.assertIn("$, ../, .., ;", result.errors[0].message)
+
+    def test_cached_issue_details_not_shared(self):
+        """Test issues for a repeated path do not share mutable details."""
+        config = {
+            "tasks": {
+                "store_a": {"params": {"data_dir": "$HOME/data"}},
+                "store_b": {"params": {"data_dir": "$HOME/data"}},
+            }
+        }
+
+        result = self.validator.validate_security(config)
+
+        self.assertEqual(len(result.warnings), 2)
+        first, second = (issue.details or {} for issue in result.warnings)
+        first["dangerous_patterns"].append("changed")
+        self.assertEqual(second["dangerous_patterns"], ["$"])
+        self.assertEqual(
+            (self.validator.validate_security(config).warnings[0].details or {})["dangerous_patterns"], ["$"]
+        )
+
     def test_unsafe_absolute_path_detection(self):
         """Test detection of unsafe absolute paths."""
         config = {
@@ -32,8 +32,9 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from .parameter_validator import ParameterValidationResult, validate_parameters
 from .path_validator import PathValidator
@@ -62,9 +63,26 @@ class ValidationMessage:
     suggestion: Optional[str] = None
 
 
+def _to_messages(issues: Iterable[Any]) -> List[ValidationMessage]:
+    """Convert validator issues into messages carrying their suggestions."""
+    # Positional (path, message, code, suggestion): keyword matching in the
+    # generated dataclass __init__ roughly doubles the cost per message
+    return [
+        ValidationMessage(
+            issue.path,
+            issue.message,
+            issue.code,
+            get_suggestion(issue.code, getattr(issue, "details", None)),
+        )
+        for issue in issues
+    ]
+
+
 class ValidationResult:
     """Aggregated validation outcome for a configuration payload."""
 
+    __slots__ = ("data", "errors", "warnings")
+
     def __init__(
         self,
         *,
@@ -73,8 +91,8 @@ class ValidationResult:
         warnings: Optional[List[ValidationMessage]] = None,
     ) -> None:
         self.data = data
-        self.errors: List[ValidationMessage] = errors or []
-        self.warnings: List[ValidationMessage] = warnings or []
+        self.errors: List[ValidationMessage] = [] if errors is None else errors
+        self.warnings: List[ValidationMessage] = [] if warnings is None else warnings
 
     @property
     def is_valid(self) -> bool:
@@ -91,6 +109,7 @@ class ConfigValidator:
         base_dir: Optional[Union[str, Path]] = None,
         import_checks: bool = False,
         check_files: bool = False,
+        file_cache: bool = True,
         performance_analysis: bool = False,
         security_analysis: bool = False,
         yaml_parser: Optional[YAMLParser] = None,
@@ -99,6 +118,7 @@ class ConfigValidator:
         self.base_dir = Path(base_dir) if base_dir else None
         self.import_checks = import_checks
         self.check_files = check_files
+        self.file_cache = file_cache
         self.performance_analysis = performance_analysis
         self.security_analysis = security_analysis
         self.parser = yaml_parser or YAMLParser()
@@ -187,11 +207,11 @@ class ConfigValidator:
         )
 
         errors = [
-            ValidationMessage(path=issue.path, message=issue.message, code="schema")
+            ValidationMessage(issue.path, issue.message, "schema")
             for issue in schema_result.errors
         ]
         warnings = [
-            ValidationMessage(path=issue.path, message=issue.message, code="schema")
+            ValidationMessage(issue.path, issue.message, "schema")
             for issue in schema_result.warnings
         ]
 
@@ -211,31 +231,10 @@ class ConfigValidator:
             config_data, import_checks=self.import_checks
         )
 
-        errors: List[ValidationMessage] = []
-        for issue in task_result.errors:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            errors.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        warnings: List[ValidationMessage] = []
-        for issue in task_result.warnings:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            warnings.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        return ValidationResult(errors=errors, warnings=warnings)
+        return ValidationResult(
+            errors=_to_messages(task_result.errors),
+            warnings=_to_messages(task_result.warnings),
+        )
 
     def _run_parameter_pass(self, config_data: Dict[str, Any]) -> ValidationResult:
         """Run parameter-level validation."""
@@ -245,31 +244,10 @@ class ConfigValidator:
 
         parameter_result: ParameterValidationResult = validate_parameters(config_data)
 
-        errors: List[ValidationMessage] = []
-        for issue in parameter_result.errors:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            errors.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        warnings: List[ValidationMessage] = []
-        for issue in parameter_result.warnings:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            warnings.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        return ValidationResult(errors=errors, warnings=warnings)
+        return ValidationResult(
+            errors=_to_messages(parameter_result.errors),
+            warnings=_to_messages(parameter_result.warnings),
+        )
 
 
     def _run_pipeline_pass(self, config_data: Dict[str, Any]) -> ValidationResult:
@@ -280,31 +258,10 @@ class ConfigValidator:
 
         pipeline_result: PipelineValidationResult = validate_pipeline(config_data)
 
-        errors: List[ValidationMessage] = []
-        for issue in pipeline_result.errors:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            errors.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        warnings: List[ValidationMessage] = []
-        for issue in pipeline_result.warnings:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            warnings.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        return ValidationResult(errors=errors, warnings=warnings)
+        return ValidationResult(
+            errors=_to_messages(pipeline_result.errors),
+            warnings=_to_messages(pipeline_result.warnings),
+        )
 
     def _run_path_pass(self, config_data: Dict[str, Any]) -> ValidationResult:
         """Run the filesystem-related validation pass."""
@@ -314,31 +271,10 @@ class ConfigValidator:
 
         path_result = self.path_validator.validate(config_data)
 
-        errors: List[ValidationMessage] = []
-        for issue in path_result.errors:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            errors.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        warnings: List[ValidationMessage] = []
-        for issue in path_result.warnings:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            warnings.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        return ValidationResult(errors=errors, warnings=warnings)
+        return ValidationResult(
+            errors=_to_messages(path_result.errors),
+            warnings=_to_messages(path_result.warnings),
+        )
 
     def _run_runtime_file_pass(self, config_data: Dict[str, Any]) -> ValidationResult:
         """Run runtime file validation pass."""
@@ -346,33 +282,12 @@ class ConfigValidator:
         if not isinstance(config_data, dict):
             return ValidationResult()
 
-        file_result = validate_runtime_files(config_data, self.base_dir)
-
-        errors: List[ValidationMessage] = []
-        for issue in file_result.errors:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            errors.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        warnings: List[ValidationMessage] = []
-        for issue in file_result.warnings:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            warnings.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
+        file_result = validate_runtime_files(config_data, self.base_dir, use_cache=self.file_cache)
 
-        return ValidationResult(errors=errors, warnings=warnings)
+        return ValidationResult(
+            errors=_to_messages(file_result.errors),
+            warnings=_to_messages(file_result.warnings),
+        )
 
     def _run_performance_pass(self, config_data: Dict[str, Any]) -> ValidationResult:
         """Run performance analysis pass."""
@@ -382,43 +297,11 @@ class ConfigValidator:
 
         performance_result: PerformanceAnalysisResult = self.performance_analyzer.analyze_performance_impact(config_data)
 
-        errors: List[ValidationMessage] = []
-        for issue in performance_result.errors:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            errors.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        warnings: List[ValidationMessage] = []
-        for issue in performance_result.warnings:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            warnings.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        # Add info messages as warnings with lower severity
-        for issue in performance_result.info:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            warnings.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        return ValidationResult(errors=errors, warnings=warnings)
+        return ValidationResult(
+            errors=_to_messages(performance_result.errors),
+            # Info findings are reported as warnings with lower severity
+            warnings=_to_messages(chain(performance_result.warnings, performance_result.info)),
+        )
 
     def _run_security_pass(self, config_data: Dict[str, Any]) -> ValidationResult:
         """Run security analysis pass."""
@@ -428,40 +311,8 @@ class ConfigValidator:
 
         security_result: SecurityAnalysisResult = self.security_validator.validate_security(config_data)
 
-        errors: List[ValidationMessage] = []
-        for issue in security_result.errors:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            errors.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        warnings: List[ValidationMessage] = []
-        for issue in security_result.warnings:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            warnings.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        # Add info messages as warnings with lower severity
-        for issue in security_result.info:
-            suggestion = get_suggestion(issue.code, getattr(issue, "details", None))
-            warnings.append(
-                ValidationMessage(
-                    path=issue.path,
-                    message=issue.message,
-                    code=issue.code,
-                    suggestion=suggestion,
-                )
-            )
-
-        return ValidationResult(errors=errors, warnings=warnings)
\ No newline at end of file
+        return ValidationResult(
+            errors=_to_messages(security_result.errors),
+            # Info findings are reported as warnings with lower severity
+            warnings=_to_messages(chain(security_result.warnings, security_result.info)),
+        )
\ No newline at end of file
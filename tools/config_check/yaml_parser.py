@@ -1,9 +1,11 @@
 """
 YAML Parser with location tracking for config-check CLI tool.
 
-This module provides a YAMLParser class that can parse YAML files with location
-information using ruamel.yaml when available, falling back to PyYAML otherwise.
-Designed for the Windows environment with proper path handling.
+This module provides a YAMLParser class that parses YAML files with PyYAML,
+using the libyaml C loader when it is compiled in, the same way the runtime
+ConfigManager loads configuration. ruamel.yaml can be requested instead for
+line/column error reporting. Designed for the Windows environment with proper
+path handling.
 
 Future enhancements under consideration include location-backed node lookups
 and ruamel round-trip preservation for richer suggestion context.
@@ -11,26 +13,74 @@ and ruamel round-trip preservation for richer suggestion context.
 
 import logging
 from collections.abc import MutableMapping as MutableMappingABC
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, MutableMapping, Optional, Tuple
 
 logger = logging.getLogger("config_check.yaml_parser")
 
 
+@lru_cache(maxsize=1)
+def _pyyaml_loader() -> Any:
+    """Return a PyYAML safe loader class that rejects duplicate mapping keys.
+
+    PyYAML keeps the last value for a repeated key; ruamel.yaml rejects it,
+    and a silently dropped task or setting is exactly what config-check is
+    meant to catch. The libyaml C loader is used when it is compiled in.
+    """
+    import yaml
+
+    base_loader: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    class _UniqueKeySafeLoader(base_loader):
+        def construct_mapping(self, node: Any, deep: bool = False) -> Any:
+            # Only the mapping's own keys are checked; keys brought in by a
+            # "<<" merge may be overridden, as ruamel.yaml allows
+            seen = set()
+            for key_node, _ in node.value:
+                if key_node.tag == "tag:yaml.org,2002:merge":
+                    continue
+                key = self.construct_object(key_node, deep=deep)
+                try:
+                    duplicate = key in seen
+                except TypeError:
+                    # Unhashable keys are rejected by the base constructor
+                    continue
+                if duplicate:
+                    raise yaml.constructor.ConstructorError(
+                        "while constructing a mapping", node.start_mark,
+                        f"found duplicate key {key!r}", key_node.start_mark,
+                    )
+                seen.add(key)
+            return super().construct_mapping(node, deep=deep)
+
+    return _UniqueKeySafeLoader
+
+
+def _pyyaml_safe_load(stream: Any) -> Any:
+    """Safe-load YAML with PyYAML, rejecting duplicate mapping keys."""
+    import yaml
+
+    return yaml.load(stream, Loader=_pyyaml_loader())
+
+
 class YAMLParser:
     """
     YAML parser with location tracking and graceful fallback handling.
 
-    Uses ruamel.yaml for enhanced location information when available,
-    otherwise falls back to PyYAML with best-effort error reporting.
+    Uses PyYAML's safe loader by default, matching how the application reads
+    its configuration at runtime, but rejecting duplicate keys as ruamel.yaml
+    does. When ruamel.yaml is preferred and available it is used for enhanced
+    location information in parse errors.
     """
 
-    def __init__(self, prefer_ruamel: bool = True) -> None:
+    def __init__(self, prefer_ruamel: bool = False) -> None:
         """
         Initialize the YAML parser with library preference.
 
         Args:
             prefer_ruamel: Whether to prefer ruamel.yaml for location tracking
+                over the faster PyYAML loader
         """
         self.prefer_ruamel = prefer_ruamel
         self._yaml_loader = None
@@ -75,17 +125,17 @@ class YAMLParser:
             - On success: (parsed_dict, None)
             - On error: (None, error_message_with_location)
         """
-        try:
-            # Resolve to absolute path for consistent error reporting
-            resolved_path = Path(path).resolve()
+        # Resolve to absolute path for consistent error reporting
+        resolved_path = Path(path).resolve()
 
+        try:
             if self._use_ruamel:
                 return self._load_with_ruamel(str(resolved_path))
             else:
                 return self._load_with_pyyaml(str(resolved_path))
 
         except Exception as e:
-            return None, f"Failed to read file '{Path(path).resolve()}': {e}"
+            return None, f"Failed to read file '{resolved_path}': {e}"
 
     def loads(self, content: str, source: str = "<string>") -> Tuple[Optional[MutableMapping[str, Any]], Optional[str]]:
         """
@@ -122,14 +172,7 @@ class YAMLParser:
             if data is None:
                 return None, f"File '{path}' is empty or contains only comments"
             elif not isinstance(data, MutableMappingABC):
-                # Try to get location info for error reporting
-                try:
-                    # Re-parse to get location information for error
-                    with open(path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    return self._loads_with_ruamel(content, path)
-                except Exception:
-                    return None, f"Root element in '{path}' must be a mapping (dictionary), got {type(data).__name__}"
+                return None, f"Root element in '{path}' must be a mapping (dictionary), got {type(data).__name__}"
 
             return data, None
 
@@ -148,7 +191,7 @@ class YAMLParser:
 
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = _pyyaml_safe_load(f)
 
             # Validate root is a mapping
             if data is None:
@@ -166,11 +209,10 @@ class YAMLParser:
     def _loads_with_ruamel(self, content: str, source: str) -> Tuple[Optional[MutableMapping[str, Any]], Optional[str]]:
         """Load YAML from string using ruamel.yaml."""
         import ruamel.yaml
-        from io import StringIO
 
         try:
             # Use type: ignore to suppress Pylance warnings for dynamic attribute access
-            data = self._yaml_loader.load(StringIO(content))  # type: ignore
+            data = self._yaml_loader.load(content)  # type: ignore
 
             # Validate root is a mapping
             if data is None:
@@ -192,10 +234,9 @@ class YAMLParser:
     def _loads_with_pyyaml(self, content: str, source: str) -> Tuple[Optional[MutableMapping[str, Any]], Optional[str]]:
         """Load YAML from string using PyYAML."""
         import yaml
-        from io import StringIO
 
         try:
-            data = yaml.safe_load(StringIO(content))
+            data = _pyyaml_safe_load(content)
 
             # Validate root is a mapping
             if data is None:
@@ -21,6 +21,7 @@ import json
 from urllib.parse import parse_qs
 
 from fastapi import FastAPI, Request, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import HTMLResponse, RedirectResponse
@@ -40,6 +41,14 @@ from modules.db.migrations import initialize_database
 from modules.services.task_registry_service import validate_startup_task_registry
 
 
+# Keeps browsers from caching the login page and its error responses
+_NO_CACHE_HEADERS = {
+    "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
+
+
 def _cors_allowed_origins(config: ConfigManager) -> list[str]:
     """Return explicitly configured CORS origins.
 
@@ -110,7 +119,9 @@ def create_app() -> FastAPI:
         - ShutdownManager is registered to handle application shutdown events.
     """
     logger = logging.getLogger("web.server")
-    config, _, _, _, _ = get_dependencies()
+    # Resolved once per app: ConfigManager is a process singleton and AuthUtils
+    # only snapshots its settings, so per-request lookups rebuilt the same objects
+    config, auth, _, _, _ = get_dependencies()
     production = _is_production()
     docs_enabled = not production or bool(config.get("web.production_docs_enabled", False))
     shutdown_manager = ShutdownManager()
@@ -167,6 +178,11 @@ def create_app() -> FastAPI:
     app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
     templates = Jinja2Templates(directory=str(templates_dir))
 
+    def _set_no_cache_headers(response: Any) -> None:
+        """Apply the shared no-cache policy to a login response."""
+
+        response.headers.update(_NO_CACHE_HEADERS)
+
     def _set_csrf_cookie(response: Any, token: str) -> None:
         """Set the browser-readable CSRF cookie used by same-origin API calls."""
 
@@ -210,8 +226,6 @@ def create_app() -> FastAPI:
             return None
 
         try:
-            # Get auth instance from dependencies
-            _, auth, _, _, _ = get_dependencies()
             username = auth.get_current_user(token)
             logger.debug(f"Valid token for user: {username}")
             return username
@@ -274,7 +288,6 @@ def create_app() -> FastAPI:
         """Render an authenticated app page with role-aware shared context."""
 
         username = await get_current_active_user(request)
-        config, auth, _, _, _ = get_dependencies()
         is_admin = _is_admin_user(username, config, auth)
         if admin_required and not is_admin:
             raise HTTPException(
@@ -306,7 +319,6 @@ def create_app() -> FastAPI:
         """Redirect demoted task configuration pages to the pipeline editor."""
 
         username = await get_current_active_user(request)
-        config, auth, _, _, _ = get_dependencies()
         if not _is_admin_user(username, config, auth):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -343,9 +355,7 @@ def create_app() -> FastAPI:
             {"request": request, "error": None, "is_authenticated": False}
         )
         # Prevent browser caching of login page
-        response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
+        _set_no_cache_headers(response)
         return response
 
     async def _extract_credentials(request: Request) -> tuple[str, str]:
@@ -397,17 +407,16 @@ def create_app() -> FastAPI:
                 "login.html",
                 {"request": request, "error": "Invalid username or password", "is_authenticated": False}
             )
-            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
+            _set_no_cache_headers(response)
             return response
 
         logger.info(f"Login attempt for username: {username}")
         
         try:
-            # Get auth instance from dependencies to ensure monkeypatching works
-            _, auth, _, _, _ = get_dependencies()
-            token = auth.login(username, password, client_id=_client_identifier(request))
+            # bcrypt verification takes hundreds of milliseconds; keep it off the event loop
+            token = await run_in_threadpool(
+                auth.login, username, password, client_id=_client_identifier(request)
+            )
             logger.info(f"Login successful for user: {username}")
             
             # Create response with redirect
@@ -427,7 +436,7 @@ def create_app() -> FastAPI:
                 samesite="lax",
                 path="/",
                 max_age=int(expires_delta.total_seconds()),
-                expires=expires_at.strftime("%a, %d %b %Y %H:%M:%S GMT")
+                expires=expires_at,
             )
             _set_csrf_cookie(response, generate_csrf_token())
             
@@ -455,9 +464,7 @@ def create_app() -> FastAPI:
                 },
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             )
-            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
+            _set_no_cache_headers(response)
             return response
             
         except AuthError:
@@ -472,9 +479,7 @@ def create_app() -> FastAPI:
                 }
             )
             # Prevent browser caching of error responses to ensure fresh error messages
-            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
+            _set_no_cache_headers(response)
             return response
 
     @app.post("/auth/login")
@@ -506,7 +511,6 @@ def create_app() -> FastAPI:
     async def app_upload_page(request: Request):
         """Serve the prototype-modeled upload and process page."""
 
-        config, _, _, _, _ = get_dependencies()
         return await render_app_page(
             request,
             "upload_process.html",